@@ -1,5 +1,5 @@
 # logger.py — CSV logger for taps (v1.0 schema, with recording_path setter)
-import csv, time, uuid, logging, errno
+import csv, time, uuid, logging, errno, threading
 from pathlib import Path
 from typing import Optional, Union
 
@@ -13,6 +13,9 @@ FRAME_TS_PRECISION = 3
 # ~1 minute at 15fps * 50 organisms ~= 45,000 rows
 TRACKING_FLUSH_ROWS = 45000
 TRACKING_FLUSH_SEC = 30.0
+# Tap rows are written by a background flusher, batched over this window
+TAP_FLUSH_INTERVAL_S = 0.1
+TAP_FLUSHER_JOIN_TIMEOUT_S = 1.0
 
 def _is_no_space_error(exc: Exception) -> bool:
     return isinstance(exc, OSError) and getattr(exc, "errno", None) == errno.ENOSPC
@@ -72,7 +75,15 @@ class RunLogger:
         self._w = None
         self._flush_error: Exception | None = None
         self._flush_error_no_space = False
+        # _lock guards _buffer; _io_lock serializes writers of the CSV file
+        self._lock = threading.Lock()
+        self._io_lock = threading.Lock()
+        self._wake = threading.Condition(self._lock)
+        self._dirty = False
+        self._closing = False
         self._init_file()
+        self._flusher = threading.Thread(target=self._flush_loop, name="RunLogger-Flush", daemon=True)
+        self._flusher.start()
 
     def _init_file(self):
         try:
@@ -95,27 +106,57 @@ class RunLogger:
         return err, no_space
 
     def has_unsaved_data(self) -> bool:
-        return len(self._buffer) > 0
+        with self._lock:
+            return len(self._buffer) > 0
 
     def retry_flush(self) -> bool:
         """Attempts to write the memory buffer to disk. Returns True if successful."""
-        if not self._buffer:
-            return True
-        if self._w is None:
-            self._init_file()
-        if self._w is None:
-            return False
-            
-        try:
-            self._w.writerows(self._buffer)
-            self._f.flush()
-            self._buffer.clear()
-            return True
-        except Exception as e:
-            APP_LOGGER.error(f"Retry flush failed: {e}")
-            self._flush_error = e
-            self._flush_error_no_space = _is_no_space_error(e)
-            return False
+        with self._io_lock:
+            with self._lock:
+                if not self._buffer:
+                    return True
+            if self._w is None:
+                self._init_file()
+            if self._w is None:
+                # _init_file recorded why; rows stay buffered for the life raft
+                return False
+            with self._lock:
+                rows = self._buffer
+                self._buffer = []
+            try:
+                self._w.writerows(rows)
+                self._f.flush()
+                return True
+            except Exception as e:
+                APP_LOGGER.error(f"Retry flush failed: {e}")
+                self._flush_error = e
+                self._flush_error_no_space = _is_no_space_error(e)
+                # Keep unwritten rows ahead of anything logged meanwhile
+                with self._lock:
+                    self._buffer[:0] = rows
+                return False
+
+    def _flush_loop(self):
+        while True:
+            with self._wake:
+                # Only new rows wake the flusher, so a failing disk is retried
+                # per tap (as before) rather than on every interval
+                while not self._dirty and not self._closing:
+                    self._wake.wait()
+                if self._closing:
+                    return
+                # Let a burst of taps land before touching the disk; close() is
+                # the only wakeup that cuts the window short
+                deadline = time.monotonic() + TAP_FLUSH_INTERVAL_S
+                while not self._closing:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._wake.wait(remaining)
+                if self._closing:
+                    return
+                self._dirty = False
+            self.retry_flush()
 
     @property
     def recording_path(self) -> str:
@@ -141,7 +182,10 @@ class RunLogger:
         preview_frame_idx: Optional[int] = None,
         recorded_frame_idx: Optional[int] = None,
     ):
-        """Append a tap row to memory and attempt to flush to taps.csv."""
+        """Append a tap row to memory; the flusher thread writes it to taps.csv."""
+        if self._closing:
+            APP_LOGGER.error(f"Tap logged after taps.csv was closed; row dropped (run {self.run_id})")
+            return
         self.tap_id += 1
         row = {
             "run_id": self.run_id,
@@ -158,10 +202,19 @@ class RunLogger:
             "frame_recorded_idx": "" if recorded_frame_idx is None else int(recorded_frame_idx),
             "recording_path": self._recording_path,
         }
-        self._buffer.append(row)
-        self.retry_flush()
+        with self._wake:
+            self._buffer.append(row)
+            # Only the clean -> dirty edge needs to start a batch
+            if not self._dirty:
+                self._dirty = True
+                self._wake.notify()
 
     def close(self):
+        with self._wake:
+            self._closing = True
+            self._wake.notify()
+        if self._flusher.is_alive() and threading.current_thread() is not self._flusher:
+            self._flusher.join(timeout=TAP_FLUSHER_JOIN_TIMEOUT_S)
         self.retry_flush()
         try:
             if self._f and not self._f.closed:
@@ -12,6 +12,20 @@ def get_resource_path(relative_path: str) -> Path:
         base_path = Path(__file__).resolve().parent.parent.parent
     return base_path / relative_path
 
+def get_cache_dir() -> Path | None:
+    """Per-user cache directory for derived assets, or None if it cannot be created."""
+    try:
+        from PySide6.QtCore import QStandardPaths
+        # Generic location + fixed name so the path doesn't depend on argv[0]
+        location = QStandardPaths.writableLocation(QStandardPaths.GenericCacheLocation)
+        if not location:
+            return None
+        path = Path(location) / "NEMESIS"
+        path.mkdir(parents=True, exist_ok=True)
+        return path
+    except Exception:
+        return None
+
 # Assets & Version
 BASE_DIR = get_resource_path(".")
 
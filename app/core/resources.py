@@ -1,4 +1,4 @@
-from typing import Any, Optional, Dict
+from typing import Any, Optional, Dict, Set
 
 class ResourceRegistry:
     """Tracks camera and serial ownership across run tabs.
@@ -8,6 +8,10 @@ class ResourceRegistry:
     def __init__(self):
         self._camera_owners: Dict[int, Any] = {}
         self._serial_owners: Dict[str, Any] = {}
+        # Reverse indexes keyed by id(owner); the forward maps hold the owner
+        # alive, so an id stays valid for as long as it is indexed here
+        self._cameras_by_owner: Dict[int, Set[int]] = {}
+        self._serials_by_owner: Dict[int, Set[str]] = {}
 
     def claim_camera(self, owner: Any, index: int) -> tuple[bool, Optional[Any]]:
         idx = int(index)
@@ -15,6 +19,7 @@ class ResourceRegistry:
         if existing is not None and existing is not owner:
             return False, existing
         self._camera_owners[idx] = owner
+        self._cameras_by_owner.setdefault(id(owner), set()).add(idx)
         return True, existing
 
     def release_camera(self, owner: Any, index: Optional[int] = None) -> None:
@@ -22,10 +27,10 @@ class ResourceRegistry:
             idx = int(index)
             if self._camera_owners.get(idx) is owner:
                 self._camera_owners.pop(idx, None)
+                self._unindex(self._cameras_by_owner, owner, idx)
             return
-        for idx, current in list(self._camera_owners.items()):
-            if current is owner:
-                self._camera_owners.pop(idx, None)
+        for idx in self._cameras_by_owner.pop(id(owner), ()):
+            self._camera_owners.pop(idx, None)
 
     def claim_serial(self, owner: Any, port: str) -> tuple[bool, Optional[Any]]:
         key = port.strip()
@@ -33,6 +38,7 @@ class ResourceRegistry:
         if existing is not None and existing is not owner:
             return False, existing
         self._serial_owners[key] = owner
+        self._serials_by_owner.setdefault(id(owner), set()).add(key)
         return True, existing
 
     def release_serial(self, owner: Any, port: Optional[str] = None) -> None:
@@ -40,11 +46,20 @@ class ResourceRegistry:
             key = port.strip()
             if self._serial_owners.get(key) is owner:
                 self._serial_owners.pop(key, None)
+                self._unindex(self._serials_by_owner, owner, key)
             return
-        for key, current in list(self._serial_owners.items()):
-            if current is owner:
-                self._serial_owners.pop(key, None)
+        for key in self._serials_by_owner.pop(id(owner), ()):
+            self._serial_owners.pop(key, None)
 
     def release_all(self, owner: Any) -> None:
         self.release_camera(owner)
         self.release_serial(owner)
+
+    @staticmethod
+    def _unindex(index: Dict[int, set], owner: Any, key: Any) -> None:
+        keys = index.get(id(owner))
+        if keys is None:
+            return
+        keys.discard(key)
+        if not keys:
+            index.pop(id(owner), None)
@@ -4,6 +4,7 @@
 # - VideoRecorder: wraps OpenCV VideoWriter with MP4→AVI fallback
 
 import cv2
+import numpy as np
 import threading
 import queue
 from pathlib import Path
@@ -72,6 +73,8 @@ class VideoRecorder:
         
         self.total_frames = 0
         self.dropped_frames = 0
+        # Resize target reused across frames; only the worker thread touches it
+        self._resize_buf = None
         
         self._open_writer()
         self._thread.start()
@@ -141,13 +144,22 @@ class VideoRecorder:
                     # Offload the resize cost to this thread too
                     h, w = frame.shape[:2]
                     if (w, h) != self.frame_size:
-                        frame = cv2.resize(frame, self.frame_size)
+                        frame = self._resize_into_buffer(frame)
                     self.writer.write(frame)
                 except Exception as e:
                     APP_LOGGER.error(f"Error writing video frame in VideoRecorder worker: {e}") 
             
             self._queue.task_done()
 
+    def _resize_into_buffer(self, frame):
+        out_w, out_h = self.frame_size
+        buf = self._resize_buf
+        expected = (out_h, out_w) + frame.shape[2:]
+        if buf is None or buf.shape != expected or buf.dtype != frame.dtype:
+            buf = self._resize_buf = np.empty(expected, dtype=frame.dtype)
+        # VideoWriter.write() has consumed the previous frame by the time we get here
+        return cv2.resize(frame, self.frame_size, dst=buf)
+
     def write(self, bgr_frame):
         if not self.is_open():
             return
@@ -3,12 +3,13 @@ import threading
 import time
 import multiprocessing
 import queue
+import collections
 import os
 import shiboken6
 import numpy as np
 from typing import Optional
 from PySide6.QtCore import QObject, Signal, Slot
-from PySide6.QtGui import QImage, QPainter
+from PySide6.QtGui import QImage
 
 from app.core import video
 from app.core.logger import APP_LOGGER
@@ -19,6 +20,7 @@ DEFAULT_FRAME_INTERVAL_MS = 33
 MIN_FRAME_INTERVAL_S = 0.005
 DEFAULT_BUFFER_COUNT = 3
 RENDER_QUEUE_MAX = 2
+RENDER_OUTPUT_BUFFERS = 2
 QUEUE_POLL_TIMEOUT_S = 0.1
 THREAD_JOIN_TIMEOUT_S = 0.2
 STOP_JOIN_SLICE_S = 0.1
@@ -37,6 +39,12 @@ class RenderWorker(QObject):
         self._queue = queue.Queue(maxsize=RENDER_QUEUE_MAX) # Backpressure if UI is slow
         self._running = False
         self._thread: threading.Thread | None = None
+        # Overlay frames are composed into reusable output buffers. Each emitted
+        # image pins its slot (None for a one-off allocation) until the GUI calls
+        # image_consumed(); queued delivery keeps the releases in emit order.
+        self._out_bufs: list[np.ndarray | None] = [None] * RENDER_OUTPUT_BUFFERS
+        self._held_slots: collections.deque[int | None] = collections.deque()
+        self._held_lock = threading.Lock()
 
     def start(self):
         self._running = True
@@ -63,6 +71,24 @@ class RenderWorker(QObject):
         except queue.Full:
             pass
 
+    def image_consumed(self):
+        """Release the buffer behind the oldest emitted image (GUI thread)."""
+        with self._held_lock:
+            if self._held_slots:
+                self._held_slots.popleft()
+
+    def _overlay_target(self, shape) -> tuple[np.ndarray | None, int | None]:
+        with self._held_lock:
+            held = set(self._held_slots)
+        for slot, buf in enumerate(self._out_bufs):
+            if slot in held:
+                continue
+            if buf is None or buf.shape != shape:
+                buf = np.empty(shape, dtype=np.uint8)
+                self._out_bufs[slot] = buf
+            return buf, slot
+        return None, None
+
     def _render_loop(self):
         while self._running:
             try:
@@ -70,7 +96,7 @@ class RenderWorker(QObject):
                 task = self._queue.get(timeout=QUEUE_POLL_TIMEOUT_S)
                 bgr, mask, idx = task
                 
-                # 1. Create Base QImage (Zero copy if possible from buffer)
+                # 1. Input frame (zero copy if possible from buffer)
                 # Note: QImage references the buffer. 
                 # BGR buffer comes from SharedMemory or VideoCapture. 
                 # If it's from SHM, it's stable until overwritten (Seqlock protects read, but this is Render).
@@ -80,54 +106,43 @@ class RenderWorker(QObject):
                 # Let's assume input 'bgr' is safe to read for now (it's usually a numpy array).
                 
                 h, w, ch = bgr.shape
-                bytes_per_line = ch * w
-                
-                # Make a deep copy to QImage.Format_BGR888 to ensure we own the memory for painting
-                # converting to RGB888 might be needed for some QPainter operations, but BGR is usually fine.
-                # Actually, QPainter on BGR888 works fine.
-                
-                # We need to copy because we are going to modify it (overlay) or just to detach from source.
-                # QImage(data, ...) creates a view. .copy() creates a deep copy.
-                base_img = QImage(bgr.data, w, h, bytes_per_line, QImage.Format_BGR888).copy()
-                
-                # 2. Draw Overlay
-                if mask is not None:
+
+                # 2. Overlay: the CV mask is binary (0/255), so the Screen blend
+                # reduces to a per-pixel max. The result goes to a free output
+                # buffer, leaving the frame shared with the recorder untouched.
+                slot = None
+                if mask is not None and mask.shape == (h, w) and bgr.dtype == np.uint8:
                     try:
-                        painter = QPainter(base_img)
-                        # Tint the mask red and draw it
-                        # This is the expensive part (blending)
-                        
-                        # Optimization: 
-                        # If mask is binary, we can use it as a stencil?
-                        # Or convert to QImage and draw.
-                        
-                        mh, mw = mask.shape
-                        if mh == h and mw == w:
-                            # Create Mask QImage (Grayscale)
-                            mask_img = QImage(mask.data, mw, mh, mw, QImage.Format_Grayscale8)
-                            
-                            # We want to draw red where mask is white.
-                            # Method: Set clip region? Or composition mode.
-                            # Simpler: Draw the mask image with a Colorize effect? 
-                            # QPainter doesn't have simple "colorize".
-                            
-                            # Alternative: Use the mask as an Alpha Channel for a solid Red image.
-                            # But creating that is also work.
-                            
-                            # Fallback to the previous logic but off-thread:
-                            # Just drawing the grayscale mask with opacity is useful for debugging.
-                            # Or we can treat it as an alpha map.
-                            
-                            painter.setCompositionMode(QPainter.CompositionMode_Screen)
-                            # Draw mask as a whitish overlay
-                            painter.drawImage(0, 0, mask_img)
-                            
-                        painter.end()
+                        out, slot = self._overlay_target(bgr.shape)
+                        if out is None:
+                            # GUI still holds every buffer; fall back to a fresh frame
+                            bgr = np.maximum(bgr, mask[:, :, None])
+                        else:
+                            bgr = np.maximum(bgr, mask[:, :, None], out=out)
                     except Exception as e:
+                        slot = None
                         APP_LOGGER.error(f"Render Error: {e}")
 
-                # 3. Emit Result
+                # 3. Base QImage. QImage(data, ...) creates a view that keeps a reference to the array,
+                # so the frame is emitted as-is (the GUI's fromImage makes the only copy).
+                bytes_per_line = bgr.strides[0]
+                if bgr.flags['C_CONTIGUOUS']:
+                    buf = bgr
+                elif bgr.strides[1] == ch and bgr.strides[2] == 1 and bytes_per_line > 0:
+                    # Padded rows (e.g. a cropped view): span the rows in place
+                    # and let bytesPerLine skip the padding instead of repacking.
+                    buf = np.lib.stride_tricks.as_strided(
+                        bgr, shape=(bytes_per_line * (h - 1) + w * ch,), strides=(1,)
+                    )
+                else:
+                    buf = bgr = np.ascontiguousarray(bgr)
+                    bytes_per_line = ch * w
+                base_img = QImage(buf.data, w, h, bytes_per_line, QImage.Format_BGR888)
+
+                # 4. Emit Result
                 if shiboken6.isValid(self):
+                    with self._held_lock:
+                        self._held_slots.append(slot)
                     self.imageReady.emit(base_img, idx)
 
             except queue.Empty:
@@ -149,6 +164,9 @@ class FrameWorker(QObject):
         self._running = False
         self._thread: threading.Thread | None = None
         self._frame_idx = 0
+        # When enabled, at most one frameReady is queued to the consumer at a time
+        self._drop_late = False
+        self._inflight = False
         self.shm_manager: Optional[SharedMemoryManager] = None
         self.mask_shm_manager: Optional[SharedMemoryManager] = None
         self.shm_name = f"nemesis_video_shm_{os.getpid()}"
@@ -169,7 +187,6 @@ class FrameWorker(QObject):
             pass
 
     def _loop(self):
-        interval = self._interval_s
         next_tick = time.perf_counter()
 
         try:
@@ -247,9 +264,14 @@ class FrameWorker(QObject):
                         pass
 
                     # Emit UI update (Raw BGR - UI will handle format)
-                    # Note: UI gets every frame regardless of CV load
-                    self._emit_safe(self.frameReady, frame, self._frame_idx, ts)
-
+                    # UI gets every frame regardless of CV load, unless drop-late is
+                    # enabled and the previous frame hasn't been consumed yet
+                    if not (self._drop_late and self._inflight):
+                        self._inflight = True
+                        self._emit_safe(self.frameReady, frame, self._frame_idx, ts)
+
+                # Re-read each tick so set_interval applies without a restart
+                interval = self._interval_s
                 if interval > 0:
                     next_tick += interval
                     sleep_for = next_tick - time.perf_counter()
@@ -271,11 +293,26 @@ class FrameWorker(QObject):
             self._thread = None
             self._emit_safe(self.stopped)
 
+    @Slot(int)
+    def set_interval(self, interval_ms: int):
+        self._interval_s = max(MIN_FRAME_INTERVAL_S, float(interval_ms) / MS_PER_SEC)
+
+    def set_drop_late(self, enabled: bool):
+        self._drop_late = bool(enabled)
+        if not self._drop_late:
+            self._inflight = False
+
+    @Slot()
+    def frame_consumed(self):
+        """Acknowledge the last frameReady so the next frame may be emitted."""
+        self._inflight = False
+
     @Slot()
     def start(self):
         if self._running:
             return
         self._running = True
+        self._inflight = False
         self._thread = threading.Thread(target=self._loop, name="FrameWorkerLoop", daemon=True)
         self._thread.start()
 
@@ -1,7 +1,7 @@
 # arduino_driver.py — Robust pyserial wrapper with auto-reconnect
-import threading, queue, time
+import threading, queue, time, select, sys
 import serial
-from typing import Optional
+from typing import Callable, Optional
 
 from app.core.logger import APP_LOGGER
 from .controller_driver import ControllerDriver
@@ -14,6 +14,7 @@ CONNECTION_BACKOFF_MAX_S = 10.0
 CONNECTION_BACKOFF_MULTIPLIER = 2.0
 READ_MIN_BYTES = 1
 READ_IDLE_SLEEP_S = 0.005
+READ_WAIT_TIMEOUT_S = 0.1
 WAIT_FOR_POLL_S = 0.01
 DEFAULT_WAIT_FOR_TIMEOUT_S = 1.0
 NEWLINE_BYTES = (10, 13)
@@ -32,6 +33,20 @@ class SerialLink(ControllerDriver):
         self._baudrate: int = DEFAULT_BAUD
         self._timeout: float = DEFAULT_TIMEOUT_S
         self._lock = threading.Lock()
+        self._rx_callback: Optional[Callable[[], None]] = None
+
+    def set_rx_callback(self, callback: Optional[Callable[[], None]]):
+        """Register a callable invoked (from the reader thread) after new lines are queued."""
+        self._rx_callback = callback
+
+    def _notify_rx(self):
+        callback = self._rx_callback
+        if callback is None:
+            return
+        try:
+            callback()
+        except Exception:
+            pass
 
     def open(self, port: str, baudrate: int = DEFAULT_BAUD, timeout: float = DEFAULT_TIMEOUT_S):
         if self.is_open() and self._port == port:
@@ -90,6 +105,7 @@ class SerialLink(ControllerDriver):
             except (OSError, serial.SerialException) as e:
                 APP_LOGGER.error(f"Serial connection lost: {e}")
                 self._rx_queue.put((time.monotonic(), f"ERROR:DISCONNECTED:{e}"))
+                self._notify_rx()
                 self._close_internal()
             except Exception as e:
                 APP_LOGGER.error(f"Unexpected serial error: {e}")
@@ -102,10 +118,12 @@ class SerialLink(ControllerDriver):
         except (OSError, serial.SerialException) as e:
             APP_LOGGER.error(f"Serial connection lost: {e}")
             self._rx_queue.put((time.monotonic(), f"ERROR:DISCONNECTED:{e}"))
+            self._notify_rx()
             self._close_internal()
         except Exception as e:
             APP_LOGGER.error(f"Unexpected serial error: {e}")
             self._rx_queue.put((time.monotonic(), f"ERROR:DISCONNECTED:{e}"))
+            self._notify_rx()
             self._close_internal()
 
     def _start_reader(self):
@@ -116,9 +134,22 @@ class SerialLink(ControllerDriver):
         self._rx_thread = threading.Thread(target=self._reader_loop, daemon=True, name="SerialLink-Reader")
         self._rx_thread.start()
 
+    def _readable_fd(self) -> Optional[int]:
+        """File descriptor the reader can block on, or None to fall back to polling."""
+        if sys.platform.startswith("win"):
+            return None
+        try:
+            fd = self.ser.fileno()
+        except Exception:
+            return None
+        return fd if isinstance(fd, int) and fd >= 0 else None
+
     def _read_loop_inner(self):
         """Inner loop for reading bytes. raises Exception on disconnect."""
         buf = bytearray()
+        # POSIX ports wake the reader on incoming bytes; the select timeout
+        # only bounds how long a stop request waits
+        fd = self._readable_fd()
         while not self._stop_event.is_set() and self.ser and self.ser.is_open:
             try:
                 # Read all available bytes to minimize system calls
@@ -133,12 +164,20 @@ class SerialLink(ControllerDriver):
                 raise
             
             if not data:
-                time.sleep(READ_IDLE_SLEEP_S)
+                if fd is None:
+                    time.sleep(READ_IDLE_SLEEP_S)
+                    continue
+                try:
+                    select.select([fd], [], [], READ_WAIT_TIMEOUT_S)
+                except (OSError, ValueError):
+                    # Handle closed under us; the loop condition decides what's next
+                    fd = None
                 continue
                 
             # Process chunk
             # Scan for newlines efficiently
             if b'\n' in data or b'\r' in data:
+                queued = False
                 # Iterate byte by byte for safety (simple state machine)
                 # Optimization: Could use split() but byte-by-byte is robust for mixed \r\n
                 for b in data:
@@ -147,10 +186,14 @@ class SerialLink(ControllerDriver):
                             try:
                                 line = bytes(buf).decode(errors='replace')
                                 self._rx_queue.put((time.monotonic(), line))
+                                queued = True
                             finally:
                                 buf.clear()
                     else:
                         buf.append(b)
+                # One wake-up per chunk, however many lines it carried
+                if queued:
+                    self._notify_rx()
             else:
                 buf.extend(data)
 
@@ -158,19 +201,21 @@ class SerialLink(ControllerDriver):
         return self.send_text(ch[:1])
 
     def send_text(self, text: str) -> bool:
-        if not self.is_open():
+        return self.send_bytes(text.encode('ascii', errors='ignore'))
+
+    def send_bytes(self, data: bytes) -> bool:
+        """Write the whole payload with a single write call."""
+        if not data or not self.is_open():
             return False
-        
+
         with self._lock:
             try:
-                data = text.encode('ascii', errors='ignore')
-                if not data:
-                    return False
                 self.ser.write(data)
                 return True
             except Exception as e:
                 APP_LOGGER.error(f"Write failed: {e}")
                 self._rx_queue.put((time.monotonic(), f"ERROR:WRITE:{e}"))
+                self._notify_rx()
                 # Force a reconnect cycle
                 self._close_internal() 
                 return False
@@ -190,11 +235,32 @@ class SerialLink(ControllerDriver):
             return item[1]
         return item
 
+    def read_lines_nowait(self, with_timestamp: bool = False) -> list:
+        """Drain every queued line under a single queue lock."""
+        q = self._rx_queue
+        with q.mutex:
+            if not q.queue:
+                return []
+            items = list(q.queue)
+            q.queue.clear()
+            q.not_full.notify_all()
+        if with_timestamp:
+            return [item if isinstance(item, tuple) else (time.monotonic(), item) for item in items]
+        return [item[1] if isinstance(item, tuple) else item for item in items]
+
     def wait_for(self, substr: str, timeout_s: float = DEFAULT_WAIT_FOR_TIMEOUT_S) -> bool:
         deadline = time.monotonic() + max(0.0, timeout_s)
+        q = self._rx_queue
         while time.monotonic() < deadline:
-            line = self.read_line_nowait()
-            if line and substr in line:
-                return True
+            items = self.read_lines_nowait(with_timestamp=True)
+            for idx, (_, line) in enumerate(items):
+                if line and substr in line:
+                    # Lines after the match stay queued for the normal reader
+                    rest = items[idx + 1:]
+                    if rest:
+                        with q.mutex:
+                            q.queue.extendleft(reversed(rest))
+                            q.not_empty.notify()
+                    return True
             time.sleep(WAIT_FOR_POLL_S)
         return False
@@ -1,12 +1,14 @@
 # app/main.py
 import sys
+import hashlib
+import numpy as np
 from PySide6.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QTabWidget, QPushButton, QMenu, QStyleFactory, QTabBar, QToolButton
 )
 from PySide6.QtCore import Qt, Slot, QPoint, QObject, QTimer
 from PySide6.QtGui import QIcon
 
-from app.core.paths import LOGO_PATH, FONT_PATH
+from app.core.paths import LOGO_PATH, FONT_PATH, get_cache_dir
 from app.core.version import APP_VERSION
 from app.ui.theme import (
     build_stylesheet, active_theme, set_active_theme,
@@ -29,6 +31,13 @@ CORNER_BTN_MARGIN_PX = 6
 CORNER_BTN_PADDING_PX = (4, 12)
 APP_FONT_PT = 11
 ICON_ALPHA_THRESHOLD = 10
+# Cmd (macOS) or Ctrl elsewhere; one mask test per key press
+_SHORTCUT_MODIFIERS = Qt.MetaModifier | Qt.ControlModifier
+# Second key of the Cmd/Ctrl+T chord -> tab factory method
+_TAB_CHORD_ACTIONS = {
+    Qt.Key_R: "_create_run_tab",
+    Qt.Key_F: "_create_dashboard_tab",
+}
 
 def _apply_global_font(app: QApplication):
     """Load Typestar OCR and apply as app default if present."""
@@ -41,31 +50,49 @@ def _apply_global_font(app: QApplication):
             _FONT_FAMILY = fams[0]
             app.setFont(QFont(_FONT_FAMILY, APP_FONT_PT))
 
+def _app_icon_cache_files() -> list | None:
+    """Per-size PNG paths for the cropped icon, keyed by the source logo's stamp."""
+    cache_dir = get_cache_dir()
+    if cache_dir is None:
+        return None
+    try:
+        stamp = f"{LOGO_PATH}|{LOGO_PATH.stat().st_mtime_ns}|{ICON_ALPHA_THRESHOLD}"
+    except OSError:
+        return None
+    digest = hashlib.blake2b(stamp.encode(), digest_size=8).hexdigest()
+    return [(target, cache_dir / f"app_icon_{digest}_{target}.png") for target in APP_ICON_SIZES]
+
 def build_app_icon():
     from PySide6.QtGui import QImage, QPixmap, QPainter
-    from PySide6.QtCore import QRect
+    from PySide6.QtCore import QRect, QSize
     try:
+        cache_files = _app_icon_cache_files()
+        if cache_files and all(path.exists() for _, path in cache_files):
+            icon = QIcon()
+            for target, path in cache_files:
+                icon.addFile(str(path), QSize(target, target))
+            if not icon.isNull():
+                return icon
         image = QImage(str(LOGO_PATH))
         if image.isNull():
             return None
         width = image.width()
         height = image.height()
-        min_x, min_y = width, height
-        max_x, max_y = -1, -1
-        for y in range(height):
-            for x in range(width):
-                if image.pixelColor(x, y).alpha() > ICON_ALPHA_THRESHOLD:
-                    if x < min_x:
-                        min_x = x
-                    if x > max_x:
-                        max_x = x
-                    if y < min_y:
-                        min_y = y
-                    if y > max_y:
-                        max_y = y
-        if min_x > max_x or min_y > max_y:
+        # Bounding box of the visible pixels, read straight from the buffer
+        rgba = image.convertToFormat(QImage.Format_RGBA8888)
+        stride = rgba.bytesPerLine()
+        rows_bytes = np.frombuffer(rgba.constBits(), dtype=np.uint8, count=stride * height)
+        alpha = rows_bytes.reshape(height, stride)[:, 3:width * 4:4]
+        opaque = alpha > ICON_ALPHA_THRESHOLD
+        rows = np.any(opaque, axis=1)
+        cols = np.any(opaque, axis=0)
+        if not rows.any():
             cropped = image
         else:
+            min_y = int(rows.argmax())
+            max_y = height - 1 - int(rows[::-1].argmax())
+            min_x = int(cols.argmax())
+            max_x = width - 1 - int(cols[::-1].argmax())
             rect = QRect(min_x, min_y, max_x - min_x + 1, max_y - min_y + 1)
             cropped = image.copy(rect)
         size = max(cropped.width(), cropped.height())
@@ -82,8 +109,16 @@ def build_app_icon():
             painter.end()
         base_pix = QPixmap.fromImage(square)
         icon = QIcon()
+        cache_paths = dict(cache_files or [])
         for target in APP_ICON_SIZES:
-            icon.addPixmap(base_pix.scaled(target, target, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+            scaled = base_pix.scaled(target, target, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+            icon.addPixmap(scaled)
+            cache_path = cache_paths.get(target)
+            if cache_path is not None:
+                try:
+                    scaled.save(str(cache_path), "PNG")
+                except Exception:
+                    pass
         return icon
     except Exception as e:
         APP_LOGGER.error(f"Icon error: {e}")
@@ -160,16 +195,12 @@ class App(QWidget):
     def keyPressEvent(self, event):
         modifiers = event.modifiers()
         key = event.key()
-        is_cmd = bool(modifiers & Qt.MetaModifier)
-        is_ctrl = bool(modifiers & Qt.ControlModifier)
-        is_alt = bool(modifiers & Qt.AltModifier)
         handled = False
-        if is_cmd or is_ctrl:
-            if self._tab_chord_active and key in (Qt.Key_R, Qt.Key_F):
-                if key == Qt.Key_R:
-                    self._create_run_tab()
-                else:
-                    self._create_dashboard_tab()
+        if modifiers & _SHORTCUT_MODIFIERS:
+            is_alt = bool(modifiers & Qt.AltModifier)
+            chord_action = _TAB_CHORD_ACTIONS.get(key) if self._tab_chord_active else None
+            if chord_action is not None:
+                getattr(self, chord_action)()
                 self._tab_chord_active = False
                 self._tab_chord_triggered = True
                 handled = True
@@ -264,7 +295,11 @@ class App(QWidget):
 
     def _propagate_theme(self, name: str, source: QObject | None = None):
         set_active_theme(name) # Update global state
-        QApplication.instance().setStyleSheet(build_stylesheet(_FONT_FAMILY, 1.0))
+        app = QApplication.instance()
+        css = build_stylesheet(_FONT_FAMILY, 1.0)
+        # Re-applying an identical sheet still repolishes every widget
+        if app.styleSheet() != css:
+            app.setStyleSheet(css)
         for idx in range(self.tab_widget.count()):
             widget = self.tab_widget.widget(idx)
             if isinstance(widget, RunTab) and widget is not source:
@@ -474,7 +509,10 @@ def main():
     app = QApplication(sys.argv)
     _apply_global_font(app)
     try:
-        app.setStyle(QStyleFactory.create("Fusion"))
+        # Some platforms already default to Fusion; re-creating it would just
+        # repolish every widget for nothing
+        if app.style().name().lower() != "fusion":
+            app.setStyle(QStyleFactory.create("Fusion"))
     except Exception:
         pass
     app.setStyleSheet(build_stylesheet(_FONT_FAMILY, 1.0))
@@ -1,24 +1,28 @@
 # app/ui/tabs/run_tab.py
-import sys, time, json, uuid, csv, subprocess, io, os
+import sys, time, json, secrets, csv, subprocess, io, os, hashlib, functools
 from collections import deque
 from pathlib import Path
 from datetime import datetime, timezone
 from typing import Optional
 
+import numpy as np
+import shiboken6
+
 from PySide6.QtWidgets import (
     QWidget, QLabel, QPushButton, QFileDialog, QHBoxLayout, QVBoxLayout, QGridLayout, 
     QComboBox, QSpinBox, QDoubleSpinBox, QLineEdit, QMessageBox, QSizePolicy, 
-    QListView, QSplitter, QFrame, QSpacerItem, QCheckBox, QMenu, QDialog,
-    QApplication, QScrollArea, QGraphicsOpacityEffect, QPlainTextEdit,
+    QListView, QSplitter, QFrame, QCheckBox, QMenu, QDialog,
+    QApplication, QScrollArea, QPlainTextEdit,
     QStackedWidget
 )
 from PySide6.QtCore import (
-    QTimer, Qt, Signal, Slot, QUrl, QPropertyAnimation, QEasingCurve,
-    QAbstractAnimation, QPoint
+    QTimer, Qt, Signal, Slot, QUrl, QVariantAnimation, QEasingCurve,
+    QPoint, QEvent, QThreadPool
 )
 from PySide6.QtGui import (
     QImage,
     QPixmap,
+    QPixmapCache,
     QPainter,
     QColor,
     QDesktopServices,
@@ -26,6 +30,8 @@ from PySide6.QtGui import (
     QAction,
     QActionGroup,
     QFontDatabase,
+    QFont,
+    QFontMetrics,
 )
 
 from serial.tools import list_ports
@@ -38,11 +44,11 @@ from app.core.logger import (
 from app.core.session import RunSession
 from app.core.version import APP_VERSION
 from app.core.workers import FrameWorker, ProcessCVWorker, RenderWorker
-from app.core.paths import RUNS_DIR, LOGO_PATH, BASE_DIR
+from app.core.paths import RUNS_DIR, LOGO_PATH, BASE_DIR, get_cache_dir
 from app.core.resources import ResourceRegistry
 
 from app.ui.theme import (
-    active_theme, set_active_theme, BG, MID, TEXT, SUBTXT, ACCENT, DANGER, BORDER, 
+    active_theme, set_active_theme, BG, MID, TEXT, ACCENT, DANGER, BORDER, 
     build_stylesheet, THEMES, DEFAULT_THEME_NAME, set_macos_titlebar_appearance
 )
 from app.ui.widgets.viewer import ZoomView, PinnedPreviewWindow, AppZoomView
@@ -69,8 +75,17 @@ SPLITTER_HANDLE_WIDTH = 10
 SPLITTER_LEFT_RATIO = 0.65
 MIRROR_SPLITTER_FIXED_WIDTH = 500
 MIRROR_SPLITTER_FILL = 100000
+MIRROR_SPLITTER_FIXED_HEIGHT = 250
+MIRROR_SPLITTER_FILL_VERTICAL = 10000
+# (controls size, content fill weight) keyed by "is vertical"
+MIRROR_SPLITTER_PLAN = {
+    False: (MIRROR_SPLITTER_FIXED_WIDTH, MIRROR_SPLITTER_FILL),
+    True: (MIRROR_SPLITTER_FIXED_HEIGHT, MIRROR_SPLITTER_FILL_VERTICAL),
+}
+MIRROR_LAYOUT_DEBOUNCE_MS = 16
 PREVIEW_ASPECT_RATIO = (16, 9)
 THEME_TRANSITION_MS = 500
+THEME_APPLY_DEBOUNCE_MS = 30
 STATUS_ROW_SPACING = 12
 SECTION_GAP_LARGE = 24
 SECTION_GAP_REDUCTION = 8
@@ -110,7 +125,8 @@ CAMERA_INDEX_MIN = 0
 CAMERA_INDEX_MAX = 8
 CAMERA_INDEX_DEFAULT = 0
 STATUS_TIMER_INTERVAL_MS = 400
-SERIAL_TIMER_INTERVAL_MS = 50
+SERIAL_STATUS_FLUSH_MS = 16
+SECTION_SPACER_DEBOUNCE_MS = 16
 PREVIEW_FPS_DEFAULT = 30
 AUTO_STOP_MAX_MIN = 20000.0
 AUTO_STOP_MIN_MIN = 0.0
@@ -134,6 +150,12 @@ STEPSIZE_OPTIONS = [
     "4 (1/8 Step)",
     "5 (1/16 Step)",
 ]
+# Combo label -> microstep code; "-" (unset) is absent
+_STEPSIZE_BY_LABEL = {
+    label: int(label[0])
+    for label in STEPSIZE_OPTIONS
+    if label[0].isdigit() and STEPSIZE_MIN <= int(label[0]) <= STEPSIZE_MAX
+}
 RUN_DIR_CREATE_RETRIES = 5
 RUN_SCHEMA_VERSION = 6
 GITHUB_README_URL = "https://github.com/svdrecbd/NEMESIS"
@@ -144,8 +166,19 @@ MS_PER_SEC = 1000.0
 LOW_DISK_TRACKING_DECIMATE = 2
 LOW_DISK_STATUS_LABEL = "LOW DISK MODE (15 FPS LOG)"
 DISK_FULL_STATUS_LABEL = "DISK FULL (BUFFERING)"
+_COUNTERS_FMT = (
+    "Taps: {taps} | Contraction %: {contracted_pct:.1f}% | "
+    "Elapsed: {elapsed:.1f} s | "
+    "Rate10: {rate10} /min | Overall: {overall:.1f} /min"
+)
 STARTER_GUIDE_VERSION = 1
 DISK_CALIBRATION_DURATION_S = 15.0
+BACKGROUND_FRAME_INTERVAL_MS = 150
+PREVIEW_BACKPRESSURE_EMA_ALPHA = 0.1
+PREVIEW_BACKPRESSURE_HIGH = 0.8
+PREVIEW_BACKPRESSURE_LOW = 0.2
+PREVIEW_BACKPRESSURE_HOLD_S = 1.0
+PREVIEW_STRIDE_MAX = 4
 DISK_ESTIMATE_MARGIN = 1.5
 DISK_ESTIMATE_GB_DIVISOR = 1_000_000_000.0
 DIAG_SAMPLE_INTERVAL_S_DEFAULT = 10.0
@@ -182,6 +215,117 @@ DIAG_FIELDS = [
     "note",
 ]
 
+# (widget attribute, signal, RunTab slot) wired once at the end of __init__
+_UI_SIGNAL_CONNECTIONS = (
+    ("cam_btn", "clicked", "_open_camera"),
+    ("serial_btn", "clicked", "_toggle_serial"),
+    ("tap_btn", "clicked", "_manual_tap"),
+    ("rec_start_btn", "clicked", "_start_recording"),
+    ("rec_stop_btn", "clicked", "_stop_recording"),
+    ("run_start_btn", "clicked", "_start_run"),
+    ("run_stop_btn", "clicked", "_stop_run"),
+    ("clear_data_btn", "clicked", "_clear_run_data"),
+    ("outdir_btn", "clicked", "_choose_outdir"),
+    ("mode", "currentIndexChanged", "_mode_changed"),
+    ("save_cfg_btn", "clicked", "_save_config_clicked"),
+    ("load_cfg_btn", "clicked", "_load_config_clicked"),
+    ("warmup_sec", "editingFinished", "_on_warmup_changed"),
+    ("stepsize", "currentTextChanged", "_on_stepsize_changed"),
+    ("port_edit", "editTextChanged", "_on_port_text_changed"),
+)
+
+# Buttons that send a single serial command character: (widget attr, char, status label)
+_SERIAL_CHAR_BUTTONS = (
+    ("enable_btn", "e", "Enable motor"),
+    ("disable_btn", "d", "Disable motor"),
+    ("jog_up_btn", "r", "Raise arm"),
+    ("jog_down_btn", "l", "Lower arm"),
+)
+
+# Popup QSS keyed by the palette values it is built from
+_COMBO_POPUP_QSS_CACHE: dict[tuple[str, ...], str] = {}
+
+# Widest label text measured once per font; one QFontMetrics per distinct font
+_TEXT_ADVANCE_CACHE: dict[tuple[str, tuple[str, ...]], int] = {}
+_FONT_METRICS_CACHE: dict[str, QFontMetrics] = {}
+_CONTROL_LABELS = (
+    "Mode:", "Period:", "λ (taps/min):", "Stepsize:",
+    "Replicant:", "Warmup:", "Acclimation:", "Stop after (min):",
+)
+
+def _max_text_advance(font: QFont, texts: tuple[str, ...]) -> int:
+    key = (font.key(), texts)
+    cached = _TEXT_ADVANCE_CACHE.get(key)
+    if cached is not None:
+        return cached
+    fm = _FONT_METRICS_CACHE.get(key[0])
+    if fm is None:
+        fm = QFontMetrics(font)
+        _FONT_METRICS_CACHE[key[0]] = fm
+    value = max((fm.horizontalAdvance(t) for t in texts), default=0)
+    _TEXT_ADVANCE_CACHE[key] = value
+    return value
+
+def _compose_footer_logo_image(outline_color: str) -> QImage | None:
+    """Black logo silhouette with a 1px outline; QImage-only so it can run off the GUI thread."""
+    candidate = QImage(str(LOGO_PATH))
+    if candidate.isNull():
+        return None
+    candidate = candidate.convertToFormat(QImage.Format_ARGB32_Premultiplied)
+    target_w = max(1, int(candidate.width() * FOOTER_LOGO_SCALE))
+    target_h = max(1, int(candidate.height() * FOOTER_LOGO_SCALE))
+    footer = candidate.scaled(target_w, target_h, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+    src = footer.convertToFormat(QImage.Format_ARGB32)
+    w, h = src.width(), src.height()
+    # View the ARGB32 scanlines as uint32 pixels; alpha is the top byte
+    pixels = np.frombuffer(src.constBits(), dtype=np.uint32, count=h * src.bytesPerLine() // 4)
+    pixels = pixels.reshape(h, src.bytesPerLine() // 4)[:, :w]
+    mask = (pixels >> 24) > LOGO_ALPHA_THRESHOLD
+    # Trim near-transparent padding so the outline tracks the glyph, not the image box
+    rows = np.flatnonzero(mask.any(axis=1))
+    cols = np.flatnonzero(mask.any(axis=0))
+    if rows.size:
+        min_y, max_y = int(rows[0]), int(rows[-1])
+        min_x, max_x = int(cols[0]), int(cols[-1])
+        crop_w = max_x - min_x + 1
+        crop_h = max_y - min_y + 1
+        footer = footer.copy(min_x, min_y, crop_w, crop_h)
+        mask = mask[min_y:max_y + 1, min_x:max_x + 1]
+        w, h = crop_w, crop_h
+
+    masked = QImage(w, h, QImage.Format_ARGB32_Premultiplied)
+    masked.fill(Qt.transparent)
+    painter = QPainter(masked)
+    painter.fillRect(masked.rect(), Qt.black)
+    painter.setCompositionMode(QPainter.CompositionMode_DestinationIn)
+    painter.drawImage(0, 0, footer)
+    painter.end()
+
+    # Edge pixels are opaque pixels with any of their 8 neighbours transparent
+    # (out-of-bounds counts as transparent), i.e. mask minus its 3x3 erosion.
+    # The 3x3 box erosion is separable: erode along rows, then along columns.
+    eroded = mask.copy()
+    eroded[:, 1:] &= mask[:, :-1]
+    eroded[:, :-1] &= mask[:, 1:]
+    eroded[:, 0] = False
+    eroded[:, -1] = False
+    interior = eroded.copy()
+    interior[1:] &= eroded[:-1]
+    interior[:-1] &= eroded[1:]
+    interior[0] = False
+    interior[-1] = False
+    edge_px = np.zeros((h, w), dtype=np.uint32)
+    edge_px[mask & ~interior] = QColor(outline_color).rgba()
+    outline = QImage(edge_px.data, w, h, w * 4, QImage.Format_ARGB32).copy()
+
+    composed = QImage(w, h, QImage.Format_ARGB32_Premultiplied)
+    composed.fill(Qt.transparent)
+    painter = QPainter(composed)
+    painter.drawImage(0, 0, masked)
+    painter.drawImage(0, 0, outline)
+    painter.end()
+    return composed
+
 def _log_gui_exception(e: Exception, context: str = "GUI operation") -> None:
     APP_LOGGER.error(f"Unhandled GUI exception in {context}: {e}", exc_info=True)
 
@@ -429,7 +573,7 @@ class SettingsDialog(ThemedDialog):
         layout.addWidget(btn_guide)
         
         btn_ports = QPushButton("Refresh Ports")
-        btn_ports.clicked.connect(parent_tab._refresh_serial_ports)
+        btn_ports.clicked.connect(lambda: parent_tab._refresh_serial_ports())
         layout.addWidget(btn_ports)
         
         btn_runs = QPushButton("Open Runs Folder")
@@ -792,31 +936,62 @@ class RunTab(QWidget):
     runCompleted = Signal(str, str)
     themeChanged = Signal(str)
     titleChanged = Signal(str)
+    _footerLogoReady = Signal(str, object)
+    _serialPortsScanned = Signal(list, bool)
+    # Emitted from the serial reader thread; delivered queued on the GUI thread
+    _serialRxReady = Signal()
+
+    class FadeOverlay(QWidget):
+        """Flat color fill; paints itself so neither a palette nor the app stylesheet is involved."""
+
+        def __init__(self, parent=None):
+            super().__init__(parent)
+            self._color = QColor(BG)
+            self.setAttribute(Qt.WA_TransparentForMouseEvents, True)
+            self.setAttribute(Qt.WA_NoSystemBackground, True)
+
+        def set_color(self, color: QColor):
+            self._color = QColor(color)
+            self.update()
+
+        def set_alpha(self, alpha):
+            if self._color.alpha() == int(alpha):
+                return
+            self._color.setAlpha(int(alpha))
+            self.update()
+
+        def paintEvent(self, event):
+            painter = QPainter(self)
+            painter.fillRect(event.rect(), self._color)
+            painter.end()
 
     class StyledCombo(QComboBox):
         def __init__(self, popup_qss: str = "", *args, **kwargs):
             super().__init__(*args, **kwargs)
             self._popup_qss = popup_qss
+            self._applied_popup_qss = ""
+            self._popup_view_ready = False
 
         def set_popup_qss(self, popup_qss: str):
             self._popup_qss = popup_qss
 
         def showPopup(self):
             try:
-                v = self.view()
-                if v is None:
-                    self.setView(QListView())
-                    v = self.view()
-                v.viewport().setAutoFillBackground(True)
-                v.setAutoFillBackground(True)
-                v.setAttribute(Qt.WA_StyledBackground, True)
-                v.setFrameShape(QFrame.NoFrame)
-                
-                v.setViewportMargins(0, 0, 0, 0)
-                if hasattr(v, 'setSpacing'):
+                # The styled list view is only built the first time the popup opens
+                if not self._popup_view_ready:
+                    v = QListView()
+                    self.setView(v)
+                    v.viewport().setAutoFillBackground(True)
+                    v.setAutoFillBackground(True)
+                    v.setAttribute(Qt.WA_StyledBackground, True)
+                    v.setFrameShape(QFrame.NoFrame)
+                    v.setViewportMargins(0, 0, 0, 0)
                     v.setSpacing(0)
+                    self._popup_view_ready = True
+                v = self.view()
 
-                if self._popup_qss:
+                # Re-polishing the popup is costly; only restyle when the QSS changed
+                if self._popup_qss and self._applied_popup_qss != self._popup_qss:
                     v.setStyleSheet(self._popup_qss)
                     v.viewport().setStyleSheet(
                         f"background: {MID}; border: none; margin: 0px; padding: 0px;"
@@ -826,6 +1001,7 @@ class RunTab(QWidget):
                         popup_win.setStyleSheet(
                             f"background: {MID}; border: 1px solid {BG}; margin: 0px; padding: 0px;"
                         )
+                    self._applied_popup_qss = self._popup_qss
                 
                 hint = 0
                 # sizeHintForColumn works for QListView; add padding for checkmark/scrollbar
@@ -848,7 +1024,11 @@ class RunTab(QWidget):
         border = palette.get("BORDER", BORDER)
         accent = palette.get("ACCENT", ACCENT)
         base = palette.get("BG", BG)
-        return (
+        key = (bg, text, border, accent, base)
+        cached = _COMBO_POPUP_QSS_CACHE.get(key)
+        if cached is not None:
+            return cached
+        qss = (
             "QListView {"
             f"background: {bg};"
             f"color: {text};"
@@ -866,6 +1046,8 @@ class RunTab(QWidget):
             f"color: {base};"
             "}"
         )
+        _COMBO_POPUP_QSS_CACHE[key] = qss
+        return qss
 
     def _refresh_combo_styles(self):
         popup_qss = self._build_combo_popup_qss()
@@ -879,53 +1061,49 @@ class RunTab(QWidget):
 
     def _refresh_branding_styles(self):
         palette = self._theme if hasattr(self, "_theme") and self._theme else active_theme()
-        accent = palette.get("ACCENT", ACCENT)
         text = palette.get("TEXT", TEXT)
-        subtxt = palette.get("SUBTXT", SUBTXT)
         current_year = time.localtime().tm_year
-        if hasattr(self, "logo_footer") and self.logo_footer:
-            if self.logo_footer.pixmap() is None:
-                try:
-                    self.logo_footer.setStyleSheet(f"color: {accent}; font-size: 16pt; font-weight: bold;")
-                except Exception:
-                    pass
+        # Label colors come from the app stylesheet (#LogoFooter, #LogoTagline,
+        # #ReplicantStatus); only the tagline's inline link color needs refreshing.
         if hasattr(self, "logo_tagline") and self.logo_tagline:
             try:
                 self.logo_tagline.setText(
                     f'© {current_year} <a href="{CALIFORNIA_NUMERICS_URL}" '
                     f'style="color: {text}; text-decoration: none;">California Numerics</a>'
                 )
-                self.logo_tagline.setStyleSheet(
-                    f"color: {text}; font-size: 10pt; font-weight: normal;"
-                )
-            except Exception:
-                pass
-        if hasattr(self, "replicant_status") and self.replicant_status:
-            try:
-                self.replicant_status.setStyleSheet(f"color: {subtxt};")
             except Exception:
                 pass
 
     def _refresh_recording_indicator(self):
         if not hasattr(self, "rec_indicator"):
             return
-        palette = self._theme if hasattr(self, "_theme") and self._theme else active_theme()
-        danger = palette.get("DANGER", DANGER)
-        subtxt = palette.get("SUBTXT", SUBTXT)
-        if getattr(self, "_recording_active", False):
-            try:
-                self.rec_indicator.setText("● REC ON")
-                self.rec_indicator.setStyleSheet(f"color:{danger}; font-weight:bold;")
-            except Exception:
-                pass
-        else:
-            try:
-                self.rec_indicator.setText("● REC OFF")
-                self.rec_indicator.setStyleSheet(f"color:{subtxt};")
-            except Exception:
-                pass
+        # Colors live in the app stylesheet under QLabel#RecIndicator[recording=...]
+        recording = bool(getattr(self, "_recording_active", False))
+        indicator = self.rec_indicator
+        try:
+            indicator.setText("● REC ON" if recording else "● REC OFF")
+            if indicator.property("recording") != recording:
+                indicator.setProperty("recording", recording)
+                indicator.style().unpolish(indicator)
+                indicator.style().polish(indicator)
+        except Exception:
+            pass
 
     def _apply_theme_to_widgets(self):
+        # Nested requests (e.g. from a child refresh) collapse into one more pass
+        if self._theme_batch_depth > 0:
+            self._theme_batch_dirty = True
+            return
+        self._theme_batch_depth += 1
+        try:
+            self._apply_theme_to_widgets_now()
+        finally:
+            self._theme_batch_depth -= 1
+        if self._theme_batch_dirty:
+            self._theme_batch_dirty = False
+            self._apply_theme_to_widgets()
+
+    def _apply_theme_to_widgets_now(self):
         theme = self._theme
         bg = theme.get("BG", BG)
         plot_face = theme.get("PLOT_FACE", bg)
@@ -985,37 +1163,14 @@ class RunTab(QWidget):
             self._apply_titlebar_theme()
         except Exception:
             pass
-        self._update_mirror_layout()
+        self._schedule_mirror_layout()
 
     def _sync_logo_menu_checks(self):
-        if hasattr(self, "_action_light_mode") and self._action_light_mode:
-            try:
-                self._action_light_mode.blockSignals(True)
-                self._action_light_mode.setChecked(self._theme_name == "light")
-                self._action_light_mode.blockSignals(False)
-            except Exception:
-                pass
-        if hasattr(self, "_action_dark_mode") and self._action_dark_mode:
-            try:
-                self._action_dark_mode.blockSignals(True)
-                self._action_dark_mode.setChecked(self._theme_name == "dark")
-                self._action_dark_mode.blockSignals(False)
-            except Exception:
-                pass
-        if hasattr(self, "_action_mirror_mode") and self._action_mirror_mode:
-            try:
-                self._action_mirror_mode.blockSignals(True)
-                self._action_mirror_mode.setChecked(self._mirror_mode)
-                self._action_mirror_mode.blockSignals(False)
-            except Exception:
-                pass
-        if hasattr(self, "_action_wide_mode") and self._action_wide_mode:
-            try:
-                self._action_wide_mode.blockSignals(True)
-                self._action_wide_mode.setChecked(self._wide_mode)
-                self._action_wide_mode.blockSignals(False)
-            except Exception:
-                pass
+        # (action, predicate) pairs registered when the logo menu is built
+        for action, is_checked in getattr(self, "_logo_menu_bindings", ()):
+            action.blockSignals(True)
+            action.setChecked(is_checked())
+            action.blockSignals(False)
 
     def _apply_theme(self, name: str, *, broadcast: bool = True, force: bool = False):
         if not force and name == self._theme_name:
@@ -1032,18 +1187,29 @@ class RunTab(QWidget):
             theme_map = THEMES.get(name, THEMES.get(DEFAULT_THEME_NAME, active_theme()))
         self._theme_name = name
         self._theme = dict(theme_map)
-        if broadcast:
-            app = QApplication.instance()
-            if app is not None:
-                try:
-                    app.setStyleSheet(build_stylesheet(_FONT_FAMILY, self.ui_scale))
-                except Exception:
-                    pass
-        self._refresh_combo_styles()
-        self._apply_theme_to_widgets()
-        self._refresh_branding_styles()
-        self._refresh_recording_indicator()
-        self._sync_logo_menu_checks()
+        # Suppress repaints while every restyle below lands, then paint once
+        updates_were_enabled = self.updatesEnabled()
+        if updates_were_enabled:
+            self.setUpdatesEnabled(False)
+        try:
+            if broadcast:
+                app = QApplication.instance()
+                if app is not None:
+                    try:
+                        css = build_stylesheet(_FONT_FAMILY, float(self.ui_scale), THEMES[name])
+                        # Re-applying an identical sheet still repolishes every widget
+                        if app.styleSheet() != css:
+                            app.setStyleSheet(css)
+                    except Exception:
+                        pass
+            self._refresh_combo_styles()
+            self._apply_theme_to_widgets()
+            self._refresh_branding_styles()
+            self._refresh_recording_indicator()
+            self._sync_logo_menu_checks()
+        finally:
+            if updates_were_enabled:
+                self.setUpdatesEnabled(True)
         if broadcast and old_bg:
             self._start_theme_transition(old_bg)
         if broadcast:
@@ -1052,9 +1218,27 @@ class RunTab(QWidget):
             except Exception:
                 pass
 
+    def _request_theme(self, name: str):
+        # Menu-driven switches are coalesced: a burst applies only the last choice
+        self._theme_apply_pending = name
+        if not self._theme_apply_timer.isActive():
+            self._theme_apply_timer.start()
+
+    def _flush_theme_request(self):
+        name = self._theme_apply_pending
+        self._theme_apply_pending = None
+        if name is None or name == self._theme_name:
+            self._sync_logo_menu_checks()
+            return
+        self._apply_theme(name)
+
     def apply_theme_external(self, name: str):
         self._apply_theme(name, broadcast=False, force=True)
 
+    @Slot(str)
+    def _on_arm_name_changed(self, text: str):
+        self.titleChanged.emit(text if text.strip() else "Run Tab")
+
     def _set_wide_mode(self, enabled: bool):
         enabled = bool(enabled)
         if enabled == self._wide_mode:
@@ -1242,7 +1426,9 @@ class RunTab(QWidget):
                 if i == len(sections) - 1:
                     main_layout.addStretch(1)
         
-        # Replace widget in scroll area
+        # Replace widget in scroll area; the rebuilt layouts space sections
+        # themselves and the old dividers go away with the old widget
+        self._section_dividers = []
         self._right_scroll.setWidget(new_widget)
         self._right_widget = new_widget
         self._right_layout = main_layout
@@ -1255,7 +1441,18 @@ class RunTab(QWidget):
             new_widget.setMinimumWidth(RIGHT_PANEL_MIN_WIDTH)
             new_widget.setMinimumHeight(600)
 
+    def _schedule_mirror_layout(self):
+        # Collapse bursts (theme refreshes) into a single splitter pass
+        timer = getattr(self, "_mirror_layout_timer", None)
+        if timer is None:
+            self._update_mirror_layout()
+            return
+        timer.start()
+
     def _update_mirror_layout(self):
+        timer = getattr(self, "_mirror_layout_timer", None)
+        if timer is not None:
+            timer.stop()
         split = getattr(self, "splitter", None)
         left = getattr(self, "_left_widget", None)   # Video/Chart Container
         right = getattr(self, "_right_scroll", None) # Controls Container
@@ -1265,7 +1462,19 @@ class RunTab(QWidget):
         # Mirror mode logic:
         # Standard: Content -> Controls
         # Mirror: Controls -> Content
-        desired = (right, left) if self._mirror_mode else (left, right)
+        is_vertical = (split.orientation() == Qt.Vertical)
+        # A horizontal mirror is a right-to-left splitter, which swaps the panes
+        # visually without moving widgets. RTL does not flip a vertical splitter,
+        # so wide mode still reorders.
+        flip_direction = self._mirror_mode and not is_vertical
+        for pane in (left, right):
+            # Pin the panes to LTR so the splitter's direction doesn't leak into them
+            if not pane.testAttribute(Qt.WA_SetLayoutDirection):
+                pane.setLayoutDirection(Qt.LeftToRight)
+        direction = Qt.RightToLeft if flip_direction else Qt.LeftToRight
+        if split.layoutDirection() != direction:
+            split.setLayoutDirection(direction)
+        desired = (right, left) if self._mirror_mode and is_vertical else (left, right)
         
         # Reorder widgets
         for idx, widget in enumerate(desired):
@@ -1277,58 +1486,61 @@ class RunTab(QWidget):
                 split.insertWidget(idx, widget)
             finally:
                 split.blockSignals(False)
-        
-        # Enforce strict sizing policies
-        is_vertical = (split.orientation() == Qt.Vertical)
-        
-        try:
-            # Determine fixed size for controls pane
-            fixed_size = MIRROR_SPLITTER_FIXED_WIDTH 
-            if is_vertical:
-                # Use a slightly smaller height for controls in vertical mode if desired
-                # But 380 is a safe bet for the scroll area content
-                fixed_size = 250 
-
-            # Apply sizes based on mirror mode
-            if self._mirror_mode:
-                # [Controls, Content]
-                if is_vertical:
-                    # Wide Mode Mirrored: Controls on Top
-                    split.setSizes([fixed_size, 10000])
-                else:
-                    # Standard Mode Mirrored: Controls on Left
-                    split.setSizes([fixed_size, MIRROR_SPLITTER_FILL])
-            else:
-                # [Content, Controls]
-                if is_vertical:
-                    # Wide Mode Standard: Controls on Bottom
-                    split.setSizes([10000, fixed_size])
-                else:
-                    # Standard Mode Standard: Controls on Right
-                    split.setSizes([MIRROR_SPLITTER_FILL, fixed_size])
-        except Exception:
-            pass
 
-        try:
-            # Ensure Content stretches and Controls are fixed
-            idx_content = split.indexOf(left)
+        # After the reorder both panes sit at their desired index
+        if split.count() == 2:
+            idx_ctrl = 0 if desired[0] is right else 1
+            idx_content = 1 - idx_ctrl
+        else:
             idx_ctrl = split.indexOf(right)
-            if idx_content >= 0:
-                split.setStretchFactor(idx_content, 1)
-            if idx_ctrl >= 0:
-                split.setStretchFactor(idx_ctrl, 0)
-            
-            # Re-disable handle interaction but keep spacing
-            split.setHandleWidth(SPLITTER_HANDLE_WIDTH)
-            split.setRubberBand(-1)
-            handle = split.handle(1)
-            if handle:
-                handle.setEnabled(False)
-                handle.setAttribute(Qt.WA_TransparentForMouseEvents, True)
-        except Exception:
+            idx_content = split.indexOf(left)
+        
+        # Enforce strict sizing policies
+        # Fixed size for controls pane; vertical (wide) mode uses a smaller height
+        fixed_size, fill = MIRROR_SPLITTER_PLAN[is_vertical]
+
+        # Query sizes once and edit that list in place
+        current = split.sizes()
+        # Qt honours pane minimums over the requested size; compare against
+        # what the splitter would actually allocate
+        min_content, min_ctrl = self._splitter_pane_mins(left, right, is_vertical)
+        target = fixed_size
+        total = sum(current)
+        if total > 0:
+            target = min(target, total - min_content)
+        target = max(target, min_ctrl)
+        on_target = 0 <= idx_ctrl < len(current) and abs(current[idx_ctrl] - target) <= 1
+
+        if on_target:
+            # Controls pane already sits on target; skip the relayout
             pass
+        elif idx_ctrl >= 0 and idx_content >= 0:
+            # Mirror: [Controls, Content]; Standard: [Content, Controls]
+            current[idx_ctrl] = fixed_size
+            current[idx_content] = fill
+            split.setSizes(current)
+
+        # Ensure Content stretches and Controls are fixed
+        if idx_content >= 0:
+            split.setStretchFactor(idx_content, 1)
+        if idx_ctrl >= 0:
+            split.setStretchFactor(idx_ctrl, 0)
+        
+        # Re-disable handle interaction but keep spacing
+        split.setHandleWidth(SPLITTER_HANDLE_WIDTH)
+        split.setRubberBand(-1)
+        handle = split.handle(1)
+        if handle:
+            handle.setEnabled(False)
+            handle.setAttribute(Qt.WA_TransparentForMouseEvents, True)
         self._apply_control_alignment()
 
+    def _splitter_pane_mins(self, content: QWidget, controls: QWidget, is_vertical: bool) -> tuple[int, int]:
+        # Explicit minimums only: the splitter never allocates less than these
+        if is_vertical:
+            return content.minimumHeight(), controls.minimumHeight()
+        return content.minimumWidth(), controls.minimumWidth()
+
     def _apply_control_alignment(self):
         right = getattr(self, "_right_layout", None)
         sections = getattr(self, "_section_layouts", None)
@@ -1363,51 +1575,29 @@ class RunTab(QWidget):
                 raise ValueError
         except Exception:
             color = QColor(BG)
-        prev_anim = getattr(self, "_theme_overlay_anim", None)
-        if prev_anim is not None:
-            try:
-                prev_anim.stop()
-            except Exception:
-                pass
-            self._theme_overlay_anim = None
-        overlay = getattr(self, "_theme_overlay", None)
-        if overlay is not None:
-            try:
-                overlay.deleteLater()
-            except Exception:
-                pass
-            self._theme_overlay = None
-        overlay = QWidget(self)
-        overlay.setObjectName("ThemeTransitionOverlay")
-        overlay.setAttribute(Qt.WA_TransparentForMouseEvents, True)
-        overlay.setAutoFillBackground(True)
-        pal = overlay.palette()
-        pal.setColor(overlay.backgroundRole(), color)
-        overlay.setPalette(pal)
+        overlay = self._theme_overlay
+        anim = self._theme_overlay_anim
+        if overlay is None or anim is None:
+            # Built once and reused; hidden between transitions. The fade animates
+            # the fill's alpha, which avoids an opacity effect rendering the
+            # window-sized overlay offscreen on every frame.
+            overlay = RunTab.FadeOverlay(self)
+            overlay.setObjectName("ThemeTransitionOverlay")
+            anim = QVariantAnimation(overlay)
+            anim.setDuration(THEME_TRANSITION_MS)
+            anim.setStartValue(255)
+            anim.setEndValue(0)
+            anim.setEasingCurve(QEasingCurve.InOutQuad)
+            anim.valueChanged.connect(overlay.set_alpha)
+            anim.finished.connect(overlay.hide)
+            self._theme_overlay = overlay
+            self._theme_overlay_anim = anim
+        anim.stop()
+        overlay.set_color(color)
         overlay.setGeometry(self.rect())
         overlay.show()
         overlay.raise_()
-        effect = QGraphicsOpacityEffect(overlay)
-        overlay.setGraphicsEffect(effect)
-        effect.setOpacity(1.0)
-        anim = QPropertyAnimation(effect, b"opacity", overlay)
-        anim.setDuration(THEME_TRANSITION_MS)
-        anim.setStartValue(1.0)
-        anim.setEndValue(0.0)
-        anim.setEasingCurve(QEasingCurve.InOutQuad)
-
-        def _cleanup():
-            try:
-                overlay.deleteLater()
-            except Exception:
-                pass
-            self._theme_overlay = None
-            self._theme_overlay_anim = None
-
-        anim.finished.connect(_cleanup)
-        anim.start(QAbstractAnimation.DeleteWhenStopped)
-        self._theme_overlay = overlay
-        self._theme_overlay_anim = anim
+        anim.start()
 
     def __init__(self, resource_registry: ResourceRegistry | None = None):
         super().__init__()
@@ -1418,17 +1608,32 @@ class RunTab(QWidget):
         self._mirror_mode = False
         self._wide_mode = False
         self._settings_dialog = None
-        self._theme_overlay: QWidget | None = None
-        self._theme_overlay_anim: QPropertyAnimation | None = None
+        self._theme_overlay: RunTab.FadeOverlay | None = None
+        self._theme_overlay_anim: QVariantAnimation | None = None
+        self._theme_batch_depth = 0
+        self._theme_batch_dirty = False
+        self._theme_apply_pending: str | None = None
+        self._theme_apply_timer = QTimer(self)
+        self._theme_apply_timer.setSingleShot(True)
+        self._theme_apply_timer.setInterval(THEME_APPLY_DEBOUNCE_MS)
+        self._theme_apply_timer.timeout.connect(self._flush_theme_request)
+        self._mirror_layout_timer = QTimer(self)
+        self._mirror_layout_timer.setSingleShot(True)
+        self._mirror_layout_timer.setTimerType(Qt.CoarseTimer)
+        self._mirror_layout_timer.setInterval(MIRROR_LAYOUT_DEBOUNCE_MS)
+        self._mirror_layout_timer.timeout.connect(self._update_mirror_layout)
 
         # Top dense status line + inline logo
         header_row = QHBoxLayout()
         self.arm_name_edit = QLineEdit()
         self.arm_name_edit.setPlaceholderText("Arm Name (e.g. Arm A)")
         self.arm_name_edit.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
-        self.arm_name_edit.textChanged.connect(lambda t: self.titleChanged.emit(t if t.strip() else "Run Tab"))
+        self.arm_name_edit.textChanged.connect(self._on_arm_name_changed)
         
         self.statusline = QLabel("—")
+        self._last_statusline_text = self.statusline.text()
+        self._statusline_state_key = None
+        self._statusline_state_parts = []
         self.statusline.setObjectName("StatusLine")
         self.statusline.setAlignment(Qt.AlignLeft | Qt.AlignVCenter)
         self.statusline.setWordWrap(True)
@@ -1437,10 +1642,7 @@ class RunTab(QWidget):
 
         # Video preview (zoomable/pannable)
         self.video_view = ZoomView(bg_color=self._theme.get("BG", BG))
-        try:
-            self.video_view.firstFrame.connect(self._on_preview_first_frame)
-        except Exception:
-            pass
+        self.video_view.firstFrame.connect(self._on_preview_first_frame)
         # Remove native frame/border; container draws border
         try:
             self.video_view.setFrameShape(QFrame.NoFrame)
@@ -1457,6 +1659,8 @@ class RunTab(QWidget):
         self.port_edit.setInsertPolicy(QComboBox.NoInsert)
         self.port_edit.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
         self.port_edit.lineEdit().setPlaceholderText("COM3 or /dev/ttyUSB0")
+        self._serial_port_scan_pending = False
+        self._serialPortsScanned.connect(self._on_serial_ports_scanned)
         self._refresh_serial_ports(initial=True)
         self.serial_btn = QPushButton("Connect")
         self.enable_btn = QPushButton("Enable Motor")
@@ -1481,24 +1685,21 @@ class RunTab(QWidget):
         self.rec_stop_btn  = QPushButton("Stop")
         self.rec_stop_btn.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
         self.rec_indicator = QLabel("● REC OFF")
+        self.rec_indicator.setObjectName("RecIndicator")
         self._recording_active = False
 
         # Scheduler controls
         popup_qss = self._build_combo_popup_qss()
         self.mode = RunTab.StyledCombo(popup_qss=popup_qss); self.mode.addItems(["Periodic", "Poisson"])
+        # Mirrors the combo (index 0 = Periodic); refreshed in _mode_changed
+        self._mode_is_periodic = True
         # Stabilize width and style popup to avoid clipping
         self.mode.setSizeAdjustPolicy(QComboBox.AdjustToMinimumContentsLengthWithIcon)
-        fm = self.mode.fontMetrics()
         max_text = max((self.mode.itemText(i) for i in range(self.mode.count())), key=len)
-        mode_w = fm.horizontalAdvance(max_text) + MODE_COMBO_TEXT_PADDING
+        mode_w = _max_text_advance(self.mode.font(), (max_text,)) + MODE_COMBO_TEXT_PADDING
         self.mode.setMinimumWidth(MODE_COMBO_MIN_WIDTH)
         self.mode.setMaximumWidth(max(MODE_COMBO_MAX_WIDTH_MIN, mode_w + MODE_COMBO_WIDTH_PADDING))
         self.mode.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
-        mv = QListView(); self.mode.setView(mv)
-        mv.viewport().setAutoFillBackground(True)
-        mv.setAutoFillBackground(True)
-        mv.setAttribute(Qt.WA_StyledBackground, True)
-        mv.setFrameShape(QFrame.NoFrame)
         self.period_sec = QDoubleSpinBox()
         self.period_sec.setRange(PERIOD_MIN_S, PERIOD_MAX_S)
         self.period_sec.setValue(PERIOD_DEFAULT_S)
@@ -1518,20 +1719,15 @@ class RunTab(QWidget):
         self.stepsize = RunTab.StyledCombo(popup_qss=popup_qss)
         self.stepsize.addItems(STEPSIZE_OPTIONS)
         self.stepsize.setCurrentIndex(0)
-        # Apply same styled popup to stepsize combobox
-        sv = QListView(); self.stepsize.setView(sv)
-        sv.viewport().setAutoFillBackground(True)
-        sv.setAutoFillBackground(True)
-        sv.setAttribute(Qt.WA_StyledBackground, True)
-        sv.setFrameShape(QFrame.NoFrame)
+        # Shadow of the combo selection, kept current by _on_stepsize_changed
+        self._stepsize_choice: Optional[int] = _STEPSIZE_BY_LABEL.get(self.stepsize.currentText().strip())
         # Compute Stepsize minimum width from item text to avoid clipping while allowing expansion
         self.stepsize.setSizeAdjustPolicy(QComboBox.AdjustToMinimumContentsLengthWithIcon)
-        s_fm = self.stepsize.fontMetrics()
         try:
             s_max_text = max((self.stepsize.itemText(i) for i in range(self.stepsize.count())), key=len)
         except ValueError:
             s_max_text = str(STEPSIZE_MAX)
-        s_w = s_fm.horizontalAdvance(s_max_text) + STEPSIZE_TEXT_PADDING  # text + arrow/padding
+        s_w = _max_text_advance(self.stepsize.font(), (s_max_text,)) + STEPSIZE_TEXT_PADDING  # text + arrow/padding
         self.stepsize.setFixedWidth(max(shared_control_width, s_w + STEPSIZE_WIDTH_PADDING))
         self.stepsize.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
 
@@ -1541,6 +1737,7 @@ class RunTab(QWidget):
         self.replicant_clear_btn = QPushButton("Clear")
         self.replicant_clear_btn.clicked.connect(self._clear_replicant_csv)
         self.replicant_status = QLabel("No script loaded")
+        self.replicant_status.setObjectName("ReplicantStatus")
         self.replicant_status.setWordWrap(False)
         self.replicant_status.setAlignment(Qt.AlignLeft | Qt.AlignVCenter)
         self.replicant_status.setSizePolicy(QSizePolicy.MinimumExpanding, QSizePolicy.Fixed)
@@ -1611,6 +1808,7 @@ class RunTab(QWidget):
             "Taps: 0 | Contractions: 0 | Elapsed: 0 s | Rate10: -- /min | Overall: 0.0 /min"
         )
         self.counters.setWordWrap(True)
+        self._last_counters_text = self.counters.text()
         serial_status_row = QHBoxLayout()
         serial_status_row.setContentsMargins(0, 0, 0, 0)
         serial_status_row.setSpacing(STATUS_ROW_SPACING)
@@ -1626,72 +1824,14 @@ class RunTab(QWidget):
 
         self.logo_footer = QLabel()
         self.logo_footer.setAlignment(Qt.AlignLeft | Qt.AlignBottom)
-        footer_pm = None
-        if LOGO_PATH.exists():
-            candidate = QPixmap(str(LOGO_PATH))
-            if not candidate.isNull():
-                target_w = max(1, int(candidate.width() * FOOTER_LOGO_SCALE))
-                target_h = max(1, int(candidate.height() * FOOTER_LOGO_SCALE))
-                footer_pm = candidate.scaled(target_w, target_h, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-        if footer_pm is not None:
-            src = footer_pm.toImage().convertToFormat(QImage.Format_ARGB32)
-            w, h = src.width(), src.height()
-            alpha_threshold = LOGO_ALPHA_THRESHOLD
-            # Trim near-transparent padding so the outline tracks the glyph, not the image box
-            min_x, min_y = w, h
-            max_x, max_y = -1, -1
-            for y in range(h):
-                for x in range(w):
-                    if src.pixelColor(x, y).alpha() > alpha_threshold:
-                        if x < min_x: min_x = x
-                        if y < min_y: min_y = y
-                        if x > max_x: max_x = x
-                        if y > max_y: max_y = y
-            if max_x >= min_x and max_y >= min_y:
-                crop_w = max_x - min_x + 1
-                crop_h = max_y - min_y + 1
-                footer_pm = footer_pm.copy(min_x, min_y, crop_w, crop_h)
-                src = src.copy(min_x, min_y, crop_w, crop_h)
-                w, h = crop_w, crop_h
-
-            masked = QPixmap(w, h)
-            masked.fill(Qt.transparent)
-            painter = QPainter(masked)
-            painter.fillRect(masked.rect(), Qt.black)
-            painter.setCompositionMode(QPainter.CompositionMode_DestinationIn)
-            painter.drawPixmap(0, 0, footer_pm)
-            painter.end()
-
-            outline = QImage(w, h, QImage.Format_ARGB32)
-            outline.fill(Qt.transparent)
-            for y in range(h):
-                for x in range(w):
-                    if src.pixelColor(x, y).alpha() <= alpha_threshold:
-                        continue
-                    edge = False
-                    for dx in (-1, 0, 1):
-                        for dy in (-1, 0, 1):
-                            if dx == 0 and dy == 0:
-                                continue
-                            nx, ny = x + dx, y + dy
-                            if nx < 0 or ny < 0 or nx >= w or ny >= h or src.pixelColor(nx, ny).alpha() <= alpha_threshold:
-                                edge = True
-                                break
-                        if edge:
-                            break
-                    if edge:
-                        outline.setPixelColor(x, y, QColor(BORDER))
-
-            composed = QPixmap(w, h)
-            composed.fill(Qt.transparent)
-            painter = QPainter(composed)
-            painter.drawPixmap(0, 0, masked)
-            painter.drawImage(0, 0, outline)
-            painter.end()
+        self._footerLogoReady.connect(self._on_footer_logo_ready)
+        composed = self._load_footer_logo()
+        if composed is not None:
             self.logo_footer.setPixmap(composed)
         else:
+            # Text stand-in until the composed logo arrives (or for good if there is none)
             self.logo_footer.setText("NEMESIS")
-            self.logo_footer.setStyleSheet(f"color: {ACCENT}; font-size: 16pt; font-weight: bold;")
+        self.logo_footer.setObjectName("LogoFooter")
         self.logo_footer.setContentsMargins(0, 0, 0, 0)
         self.logo_footer.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
         self.logo_footer.setCursor(Qt.PointingHandCursor)
@@ -1708,13 +1848,12 @@ class RunTab(QWidget):
         self.logo_tagline.setTextInteractionFlags(Qt.TextBrowserInteraction)
         self.logo_tagline.setOpenExternalLinks(True)
         self.logo_tagline.setCursor(Qt.PointingHandCursor)
-        self.logo_tagline.setStyleSheet(
-            f"color: {TEXT}; font-size: 10pt; font-weight: normal;"
-        )
+        self.logo_tagline.setObjectName("LogoTagline")
         self.logo_tagline.setContentsMargins(0, LOGO_TAGLINE_TOP_MARGIN_PX, 0, 0)
         self.logo_tagline.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Fixed)
 
-        self.logo_menu = self._build_logo_menu()
+        # Built on the first right-click on the logo (_ensure_logo_menu)
+        self.logo_menu: QMenu | None = None
         serial_status_row.addStretch(1)  # keep status text left-aligned
 
         # Layout
@@ -1789,17 +1928,7 @@ class RunTab(QWidget):
         self.lbl_warmup = QLabel("Warmup:")
         self.lbl_acclimation = QLabel("Acclimation:")
         self.lbl_autostop = QLabel("Stop after (min):")
-        lfm = self.lbl_mode.fontMetrics()
-        label_w = max(
-            lfm.horizontalAdvance("Mode:"),
-            lfm.horizontalAdvance("Period:"),
-            lfm.horizontalAdvance("λ (taps/min):"),
-            lfm.horizontalAdvance("Stepsize:"),
-            lfm.horizontalAdvance("Replicant:"),
-            lfm.horizontalAdvance("Warmup:"),
-            lfm.horizontalAdvance("Acclimation:"),
-            lfm.horizontalAdvance("Stop after (min):")
-        ) + LABEL_WIDTH_PADDING_PX
+        label_w = _max_text_advance(self.lbl_mode.font(), _CONTROL_LABELS) + LABEL_WIDTH_PADDING_PX
         for lbl in (self.lbl_mode, self.lbl_period, self.lbl_lambda, self.lbl_stepsize, self.lbl_replicant, self.lbl_warmup, self.lbl_acclimation, self.lbl_autostop):
             lbl.setFixedWidth(label_w)
         controls_grid = QGridLayout()
@@ -1921,13 +2050,17 @@ class RunTab(QWidget):
             logo_section,
         ]
         self._section_layouts = sections
-        self._section_spacers = []
+        # Fixed-height divider widgets between sections. Unlike spacer items they
+        # take part in layout spacing, so their height excludes it.
+        self._section_dividers = []
         for idx, section in enumerate(sections):
             right.addLayout(section)
             if idx < len(sections) - 1:
-                spacer = QSpacerItem(0, section_gap, QSizePolicy.Minimum, QSizePolicy.Fixed)
-                self._section_spacers.append(spacer)
-                right.addItem(spacer)
+                divider = QWidget()
+                divider.setAttribute(Qt.WA_TransparentForMouseEvents, True)
+                divider.setFixedHeight(max(0, section_gap - right.spacing()))
+                self._section_dividers.append(divider)
+                right.addWidget(divider)
 
 
         # Decouple panes with a splitter so right-side changes don't tug the preview
@@ -2012,9 +2145,7 @@ class RunTab(QWidget):
             pass
         root = QHBoxLayout(self); root.setContentsMargins(0,0,0,0); root.addWidget(self.app_view)
         # Finalize minimum size after the widget is laid out so viewport >= content minimum
-        QTimer.singleShot(0, self._adjust_min_window_size)
-        QTimer.singleShot(0, self._apply_titlebar_theme)
-        QTimer.singleShot(0, self._update_section_spacers)
+        QTimer.singleShot(0, self._post_init_layout)
         self._refresh_combo_styles()
         self._refresh_branding_styles()
         self._refresh_recording_indicator()
@@ -2026,6 +2157,7 @@ class RunTab(QWidget):
         self.cap = None
         self.recorder = None
         self._frame_worker: FrameWorker | None = None
+        self._frame_stream_was_preview_only: bool | None = None
         
         # CV Worker (Process-based)
         self.cv_worker = ProcessCVWorker()
@@ -2083,6 +2215,7 @@ class RunTab(QWidget):
         self._diag_prev_cv_frames = 0
         self._diag_prev_rec_frames = 0
         self._diag_prev_drop_frames = 0
+        self._reset_preview_backpressure()
         self._auto_stop_timer = QTimer(self)
         self._auto_stop_timer.setSingleShot(True)
         self._auto_stop_timer.timeout.connect(self._on_auto_stop_due)
@@ -2090,9 +2223,22 @@ class RunTab(QWidget):
         self.status_timer = QTimer(self)
         self.status_timer.timeout.connect(self._refresh_statusline)
         self.status_timer.start(STATUS_TIMER_INTERVAL_MS)
-        self.serial_timer = QTimer(self)
-        self.serial_timer.setInterval(SERIAL_TIMER_INTERVAL_MS)
-        self.serial_timer.timeout.connect(self._drain_serial_queue)
+        # Serial lines are drained when the reader thread reports them, not on a poll timer
+        self._serialRxReady.connect(self._drain_serial_queue, Qt.QueuedConnection)
+        self.serial.set_rx_callback(self._serialRxReady.emit)
+        # Serial status text is coalesced to at most one label update per frame
+        self._pending_serial_status: str | None = None
+        self._serial_status_text = self.serial_status.text()
+        self._serial_status_timer = QTimer(self)
+        self._serial_status_timer.setSingleShot(True)
+        self._serial_status_timer.setInterval(SERIAL_STATUS_FLUSH_MS)
+        self._serial_status_timer.timeout.connect(self._flush_serial_status)
+        # Divider heights follow the window height; resize bursts collapse into one pass
+        self._section_gap_compact: bool | None = None
+        self._section_spacer_timer = QTimer(self)
+        self._section_spacer_timer.setSingleShot(True)
+        self._section_spacer_timer.setInterval(SECTION_SPACER_DEBOUNCE_MS)
+        self._section_spacer_timer.timeout.connect(self._update_section_spacers)
         
         # Staged Start logic
         self._acclimation_timer = QTimer(self)
@@ -2101,28 +2247,12 @@ class RunTab(QWidget):
         self._acclimation_end_time: float | None = None
 
         # Signals
-        self.cam_btn.clicked.connect(self._open_camera)
-        self.serial_btn.clicked.connect(self._toggle_serial)
-        self.enable_btn.clicked.connect(lambda: self._send_serial_char('e', "Enable motor"))
-        self.disable_btn.clicked.connect(lambda: self._send_serial_char('d', "Disable motor"))
-        self.tap_btn.clicked.connect(self._manual_tap)
-        self.jog_up_btn.clicked.connect(lambda: self._send_serial_char('r', "Raise arm"))
-        self.jog_down_btn.clicked.connect(lambda: self._send_serial_char('l', "Lower arm"))
-        self.rec_start_btn.clicked.connect(self._start_recording)
-        self.rec_stop_btn.clicked.connect(self._stop_recording)
-        self.run_start_btn.clicked.connect(self._start_run)
-        self.run_stop_btn.clicked.connect(self._stop_run)
-        self.clear_data_btn.clicked.connect(self._clear_run_data)
-        self.outdir_btn.clicked.connect(self._choose_outdir)
-        self.mode.currentIndexChanged.connect(self._mode_changed)
-        self.save_cfg_btn.clicked.connect(self._save_config_clicked)
-        self.load_cfg_btn.clicked.connect(self._load_config_clicked)
-        self.pro_btn.clicked.connect(self._toggle_pro_mode)
-        self.period_sec.editingFinished.connect(lambda: self._update_status("Period updated."))
-        self.lambda_rpm.editingFinished.connect(lambda: self._update_status("Lambda updated."))
-        self.warmup_sec.editingFinished.connect(self._on_warmup_changed)
-        self.stepsize.currentTextChanged.connect(self._on_stepsize_changed)
-        self.port_edit.editTextChanged.connect(self._on_port_text_changed)
+        for src, signal, slot in _UI_SIGNAL_CONNECTIONS:
+            getattr(getattr(self, src), signal).connect(getattr(self, slot))
+        for src, ch, label in _SERIAL_CHAR_BUTTONS:
+            getattr(self, src).clicked.connect(functools.partial(self._send_serial_char, ch, label))
+        self.period_sec.editingFinished.connect(functools.partial(self._update_status, "Period updated."))
+        self.lambda_rpm.editingFinished.connect(functools.partial(self._update_status, "Lambda updated."))
 
         self._mode_changed()
         self._update_status("Ready.")
@@ -2225,6 +2355,60 @@ class RunTab(QWidget):
             except Exception:
                 pass
 
+    def _load_footer_logo(self) -> QPixmap | None:
+        """Return the cached footer logo, or None and compose it off the GUI thread.
+
+        A freshly composed logo arrives through _footerLogoReady.
+        """
+        if not LOGO_PATH.exists():
+            return None
+        try:
+            stamp = f"{LOGO_PATH}|{LOGO_PATH.stat().st_mtime_ns}|{FOOTER_LOGO_SCALE}|{BORDER}|{LOGO_ALPHA_THRESHOLD}"
+        except OSError:
+            return None
+        digest = hashlib.blake2b(stamp.encode(), digest_size=8).hexdigest()
+        key = f"nemesis:footer:{digest}"
+        composed = QPixmapCache.find(key)
+        if composed is not None and not composed.isNull():
+            return composed
+        cache_dir = get_cache_dir()
+        cache_file = cache_dir / f"footer_{digest}.png" if cache_dir else None
+        if cache_file is not None and cache_file.exists():
+            composed = QPixmap(str(cache_file))
+            if not composed.isNull():
+                QPixmapCache.insert(key, composed)
+                return composed
+
+        def _compose():
+            image = _compose_footer_logo_image(BORDER)
+            if image is not None and cache_file is not None:
+                try:
+                    image.save(str(cache_file), "PNG")
+                except Exception:
+                    pass
+            if shiboken6.isValid(self):
+                try:
+                    self._footerLogoReady.emit(key, image)
+                except RuntimeError:
+                    pass
+
+        QThreadPool.globalInstance().start(_compose)
+        return None
+
+    @Slot(str, object)
+    def _on_footer_logo_ready(self, key: str, image):
+        if image is None or image.isNull():
+            return
+        composed = QPixmap.fromImage(image)
+        QPixmapCache.insert(key, composed)
+        self.logo_footer.setPixmap(composed)
+
+    def _ensure_logo_menu(self) -> QMenu:
+        if self.logo_menu is None:
+            self.logo_menu = self._build_logo_menu()
+            self._sync_logo_menu_checks()
+        return self.logo_menu
+
     def _build_logo_menu(self) -> QMenu:
         menu = QMenu(self)
         theme_group = QActionGroup(menu)
@@ -2232,13 +2416,13 @@ class RunTab(QWidget):
 
         self._action_light_mode = QAction("Light Mode", menu)
         self._action_light_mode.setCheckable(True)
-        self._action_light_mode.triggered.connect(lambda: self._apply_theme("light"))
+        self._action_light_mode.triggered.connect(lambda: self._request_theme("light"))
         menu.addAction(self._action_light_mode)
         theme_group.addAction(self._action_light_mode)
 
         action_dark = QAction("Dark Mode", menu)
         action_dark.setCheckable(True)
-        action_dark.triggered.connect(lambda: self._apply_theme("dark"))
+        action_dark.triggered.connect(lambda: self._request_theme("dark"))
         menu.addAction(action_dark)
         theme_group.addAction(action_dark)
         self._action_dark_mode = action_dark
@@ -2254,6 +2438,12 @@ class RunTab(QWidget):
         self._action_wide_mode.setCheckable(True)
         self._action_wide_mode.toggled.connect(self._set_wide_mode)
         menu.addAction(self._action_wide_mode)
+        self._logo_menu_bindings = (
+            (self._action_light_mode, lambda: self._theme_name == "light"),
+            (self._action_dark_mode, lambda: self._theme_name == "dark"),
+            (self._action_mirror_mode, lambda: self._mirror_mode),
+            (self._action_wide_mode, lambda: self._wide_mode),
+        )
 
         menu.addSeparator()
 
@@ -2264,7 +2454,7 @@ class RunTab(QWidget):
         menu.addSeparator()
 
         action_refresh_ports = QAction("Refresh Ports", menu)
-        action_refresh_ports.triggered.connect(self._refresh_serial_ports)
+        action_refresh_ports.triggered.connect(lambda: self._refresh_serial_ports())
         menu.addAction(action_refresh_ports)
 
         action_open_runs = QAction("Open Runs Folder", menu)
@@ -2342,6 +2532,11 @@ class RunTab(QWidget):
         dialog.exec()
 
     def _logo_pressed(self, event):
+        # Right-click opens the quick menu (theme/layout toggles); any other
+        # button opens the full settings dialog
+        if event.button() == Qt.RightButton:
+            self._ensure_logo_menu().popup(event.globalPosition().toPoint())
+            return
         if self._settings_dialog is None:
             self._settings_dialog = SettingsDialog(self)
         
@@ -2349,6 +2544,19 @@ class RunTab(QWidget):
         self._settings_dialog.raise_()
         self._settings_dialog.activateWindow()
 
+    def _post_init_layout(self):
+        # One deferred pass instead of a loop turn (and relayout) per step
+        updates_were_enabled = self.updatesEnabled()
+        if updates_were_enabled:
+            self.setUpdatesEnabled(False)
+        try:
+            self._apply_titlebar_theme()
+            self._update_section_spacers()
+            self._adjust_min_window_size()
+        finally:
+            if updates_were_enabled:
+                self.setUpdatesEnabled(True)
+
     def _apply_titlebar_theme(self):
         try:
             if sys.platform == "darwin":
@@ -2368,32 +2576,66 @@ class RunTab(QWidget):
             pass
 
     def _update_section_spacers(self):
-        spacers = getattr(self, "_section_spacers", None)
-        if not spacers:
+        # The divider height only depends on which side of the threshold the tab is
+        compact = self.height() < SECTION_GAP_HEIGHT_THRESHOLD
+        dividers = self._section_dividers
+        if compact == self._section_gap_compact or not dividers:
             return
-        gap = getattr(self, "_section_gap", SECTION_GAP_MIN)
-        if self.height() < SECTION_GAP_HEIGHT_THRESHOLD:
+        self._section_gap_compact = compact
+        gap = self._section_gap
+        if compact:
             gap = max(SECTION_GAP_MIN, gap - SECTION_GAP_REDUCTION)
-        for spacer in spacers:
-            spacer.changeSize(0, gap, QSizePolicy.Minimum, QSizePolicy.Fixed)
-        layout = getattr(self, "_right_layout", None)
-        if layout is not None:
-            layout.invalidate()
+        height = max(0, gap - self._right_layout.spacing())
+        for divider in dividers:
+            if divider.height() != height or divider.minimumHeight() != height:
+                divider.setFixedHeight(height)
+
+    def resizeEvent(self, e):
+        super().resizeEvent(e)
+        timer = getattr(self, "_section_spacer_timer", None)
+        if timer is not None and e.oldSize().height() != e.size().height():
+            timer.start()
 
     def _refresh_serial_ports(self, initial: bool = False):
+        # One scan in flight at a time; repeat clicks while it runs are dropped
+        if self._serial_port_scan_pending:
+            return
+        self._serial_port_scan_pending = True
+
+        def _scan():
+            try:
+                ports = [port.device for port in list_ports.comports()]
+            except Exception:
+                ports = []
+            if shiboken6.isValid(self):
+                try:
+                    self._serialPortsScanned.emit(ports, initial)
+                except RuntimeError:
+                    pass
+
+        QThreadPool.globalInstance().start(_scan)
+
+    @Slot(list, bool)
+    def _on_serial_ports_scanned(self, ports: list, initial: bool):
+        self._serial_port_scan_pending = False
+        self._apply_serial_ports(ports, initial)
+
+    def _apply_serial_ports(self, ports: list, initial: bool = False):
         current = ""
         try:
             current = self.port_edit.currentText().strip()
         except Exception:
             pass
-        ports = [port.device for port in list_ports.comports()]
+        items = list(ports)
+        if current and current not in ports:
+            items.append(current)
+        existing = [self.port_edit.itemText(i) for i in range(self.port_edit.count())]
+        if items == existing and current:
+            return
         try:
             self.port_edit.blockSignals(True)
             self.port_edit.clear()
-            for port in ports:
-                self.port_edit.addItem(port)
-            if current and current not in ports:
-                self.port_edit.addItem(current)
+            self.port_edit.addItems(items)
             if current:
                 self.port_edit.setCurrentText(current)
             elif ports:
@@ -2468,8 +2710,8 @@ class RunTab(QWidget):
         self.live_chart.set_long_run_view(str(view))
 
     def _mode_changed(self):
-        mode_text = self.mode.currentText().strip().lower()
-        is_poisson = mode_text == "poisson"
+        self._mode_is_periodic = self.mode.currentIndex() == 0
+        is_poisson = not self._mode_is_periodic
         try:
             self.period_sec.setEnabled(not is_poisson)
             self.lbl_period.setEnabled(not is_poisson)
@@ -2483,18 +2725,10 @@ class RunTab(QWidget):
         label = "Poisson" if is_poisson else "Periodic"
         self._update_status(f"Mode set to {label}.")
 
-    def _selected_stepsize(self) -> Optional[int]:
-        try:
-            text = self.stepsize.currentText().strip()
-        except Exception:
-            return None
-        if not text:
-            return None
-        if text[0].isdigit():
-            val = int(text[0])
-            if STEPSIZE_MIN <= val <= STEPSIZE_MAX:
-                return val
-        return None
+    def _selected_stepsize(self, text: str | None = None) -> Optional[int]:
+        if text is None:
+            return self._stepsize_choice
+        return _STEPSIZE_BY_LABEL.get(text.strip())
 
     def _parse_replicant_csv(self, path: Path) -> list[float]:
         times: list[float] = []
@@ -2584,12 +2818,10 @@ class RunTab(QWidget):
         if not self.serial or not self.serial.is_open():
             self._update_status("Serial not connected.")
             return False
-        payload = f"{mode_char},{stepsize},{value}\n"
-        if not self.serial.send_char("c"):
-            self._update_status("Failed to send config header.")
-            return False
-        if not self.serial.send_text(payload):
-            self._update_status("Failed to send config payload.")
+        # Header byte and payload line go out in one write
+        payload = f"c{mode_char},{stepsize},{value}\n".encode("ascii", errors="ignore")
+        if not self.serial.send_bytes(payload):
+            self._update_status("Failed to send config.")
             return False
         self._hardware_configured = True
         self._awaiting_switch_start = awaiting_switch
@@ -2601,13 +2833,12 @@ class RunTab(QWidget):
             mode_char = "H"
             value = float(self.session.replicant_total)
         else:
-            mode_text = self.mode.currentText().strip().lower()
-            if mode_text == "poisson":
-                mode_char = "R"
-                value = float(self.lambda_rpm.value())
-            else:
+            if self._mode_is_periodic:
                 mode_char = "P"
                 value = float(self.period_sec.value())
+            else:
+                mode_char = "R"
+                value = float(self.lambda_rpm.value())
         if self._send_hardware_config(mode_char, stepsize, value, awaiting_switch=True):
             self._update_status("Hardware configured. Toggle switch to begin.")
 
@@ -2656,79 +2887,102 @@ class RunTab(QWidget):
     def _reset_serial_indicator(self, state: str = "disconnected"):
         state = state.lower().strip()
         if state == "connected":
-            self.serial_status.setText("Serial connected.")
+            self._set_serial_status("Serial connected.")
             self.serial_btn.setText("Disconnect")
         elif state == "waiting":
-            self.serial_status.setText("Waiting for device…")
+            self._set_serial_status("Waiting for device…")
             self.serial_btn.setText("Disconnect")
         else:
-            self.serial_status.setText("Serial disconnected.")
+            self._set_serial_status("Serial disconnected.")
             self.serial_btn.setText("Connect")
 
+    def _set_serial_status(self, text: str):
+        self._pending_serial_status = text
+        if not self._serial_status_timer.isActive():
+            self._serial_status_timer.start()
+
+    def _flush_serial_status(self):
+        text = self._pending_serial_status
+        self._pending_serial_status = None
+        if text is not None and text != self._serial_status_text:
+            self._serial_status_text = text
+            self.serial_status.setText(text)
+
     def _drain_serial_queue(self):
         link = self.serial
         if link is None:
             return
-        while True:
-            item = link.read_line_nowait(with_timestamp=True)
-            if item is None:
-                break
-            ts, line = item if isinstance(item, tuple) else (time.monotonic(), item)
+        for ts, line in link.read_lines_nowait(with_timestamp=True):
             text = str(line).strip()
             if not text:
                 continue
-            self.serial_status.setText(f"Last serial: {text}")
-            if text.startswith("ERROR:DISCONNECTED"):
-                self._reset_serial_indicator("disconnected")
-                continue
-            if text.startswith("EVENT:TAP"):
-                parts = text.split(",", 1)
-                firmware_ms = None
-                if len(parts) == 2:
-                    try:
-                        firmware_ms = float(parts[1])
-                    except ValueError:
-                        firmware_ms = None
-                self._log_pending_tap(firmware_ms, host_time_s=ts)
-                continue
-            if text.startswith("EVENT:MODE_ACTIVATED"):
-                if self._awaiting_switch_start and not self._hardware_run_active:
-                    self._awaiting_switch_start = False
-                    self._start_run(hardware_controlled=True)
-                continue
-            if text.startswith("EVENT:MODE_DEACTIVATED"):
-                if self._hardware_run_active and not self._run_controlled_by_host:
-                    self._stop_run(from_hardware=True)
-                continue
-            if text.startswith("CONFIG:STEPSIZE="):
-                try:
-                    step = int(text.split("=", 1)[1])
-                    self.current_stepsize = step
-                except Exception:
-                    pass
-            if text.startswith("CONFIG:OK") or text.startswith("CONFIG:DONE"):
-                self._hardware_configured = True
+            self._set_serial_status(f"Last serial: {text}")
+            head, _, rest = text.partition(":")
+            handler = self._SERIAL_LINE_HANDLERS.get(head)
+            if handler is not None:
+                handler(self, rest, ts)
+
+    def _on_serial_error_line(self, rest: str, ts: float):
+        if rest.startswith("DISCONNECTED"):
+            self._reset_serial_indicator("disconnected")
 
-    def _refresh_statusline(self):
+    def _on_serial_event_line(self, rest: str, ts: float):
+        tag, _, arg = rest.partition(",")
+        handler = self._SERIAL_EVENT_HANDLERS.get(tag)
+        if handler is not None:
+            handler(self, arg, ts)
+
+    def _on_serial_config_line(self, rest: str, ts: float):
+        key, _, value = rest.partition("=")
+        if key == "STEPSIZE":
+            try:
+                self.current_stepsize = int(value)
+            except Exception:
+                pass
+            return
+        status = key.partition(",")[0]
+        if status == "OK" or status == "DONE":
+            self._hardware_configured = True
+
+    def _on_serial_tap_event(self, arg: str, ts: float):
+        firmware_ms = None
+        if arg:
+            try:
+                firmware_ms = float(arg)
+            except ValueError:
+                firmware_ms = None
+        self._log_pending_tap(firmware_ms, host_time_s=ts)
+
+    def _on_serial_mode_activated(self, arg: str, ts: float):
+        if self._awaiting_switch_start and not self._hardware_run_active:
+            self._awaiting_switch_start = False
+            self._start_run(hardware_controlled=True)
+
+    def _on_serial_mode_deactivated(self, arg: str, ts: float):
+        if self._hardware_run_active and not self._run_controlled_by_host:
+            self._stop_run(from_hardware=True)
+
+    # Serial lines dispatch on their "HEAD:" prefix, then EVENT lines on their tag
+    _SERIAL_LINE_HANDLERS = {
+        "ERROR": _on_serial_error_line,
+        "EVENT": _on_serial_event_line,
+        "CONFIG": _on_serial_config_line,
+    }
+    _SERIAL_EVENT_HANDLERS = {
+        "TAP": _on_serial_tap_event,
+        "MODE_ACTIVATED": _on_serial_mode_activated,
+        "MODE_DEACTIVATED": _on_serial_mode_deactivated,
+    }
+
+    def _build_statusline_state_parts(self, serial_port: str | None) -> list[str]:
         parts = []
-        if self._acclimation_end_time is not None:
-            remaining = max(0.0, self._acclimation_end_time - time.monotonic())
-            mins = int(remaining // 60)
-            secs = int(remaining % 60)
-            parts.append(f"ACCLIMATION: {mins:02d}:{secs:02d}")
-        if self._low_disk_mode_active:
-            parts.append(LOW_DISK_STATUS_LABEL)
-        elif self._disk_full_detected:
-            parts.append(DISK_FULL_STATUS_LABEL)
-            
         if self.cap is not None:
             idx = self.session.camera_index if self.session.camera_index is not None else "?"
             parts.append(f"Cam {idx}")
         else:
             parts.append("Cam off")
-        if self.serial and self.serial.is_open():
-            port = self._active_serial_port or self.port_edit.currentText().strip()
-            parts.append(f"Serial {port}")
+        if serial_port is not None:
+            parts.append(f"Serial {serial_port}")
         else:
             parts.append("Serial off")
         if self._recording_active:
@@ -2737,23 +2991,56 @@ class RunTab(QWidget):
             parts.append("RUN")
         if self.session.replicant_ready:
             parts.append("Replicant")
-        try:
-            self.statusline.setText(" | ".join(parts))
-        except Exception:
-            pass
+        return parts
+
+    def _refresh_statusline(self):
+        now = time.monotonic()
+        parts = []
+        if self._acclimation_end_time is not None:
+            remaining = max(0.0, self._acclimation_end_time - now)
+            mins = int(remaining // 60)
+            secs = int(remaining % 60)
+            parts.append(f"ACCLIMATION: {mins:02d}:{secs:02d}")
+        if self._low_disk_mode_active:
+            parts.append(LOW_DISK_STATUS_LABEL)
+        elif self._disk_full_detected:
+            parts.append(DISK_FULL_STATUS_LABEL)
+            
+        serial_port = None
+        if self.serial and self.serial.is_open():
+            serial_port = self._active_serial_port or self.port_edit.currentText().strip()
+        state_key = (
+            self.cap is not None,
+            self.session.camera_index,
+            serial_port,
+            self._recording_active,
+            self._hardware_run_active,
+            self.session.replicant_ready,
+        )
+        if state_key != self._statusline_state_key:
+            self._statusline_state_key = state_key
+            self._statusline_state_parts = self._build_statusline_state_parts(serial_port)
+        parts.extend(self._statusline_state_parts)
+        status_text = " | ".join(parts)
+        if status_text != self._last_statusline_text:
+            self._last_statusline_text = status_text
+            try:
+                self.statusline.setText(status_text)
+            except Exception:
+                pass
 
         self._check_disk_write_errors()
 
         if self.session.run_start is None:
             elapsed = self.session.last_run_elapsed
         else:
-            elapsed = max(0.0, time.monotonic() - self.session.run_start)
+            elapsed = max(0.0, now - self.session.run_start)
             self.session.last_run_elapsed = elapsed
         rate10 = self.session.recent_rate_per_min()
         rate10_str = "--" if rate10 is None else f"{rate10:.1f}"
         overall = 0.0
         if elapsed > 0:
-            overall = (self.session.taps / elapsed) * SECONDS_PER_MIN
+            overall = self.session.taps * (SECONDS_PER_MIN / elapsed)
             
         # Calculate instantaneous contraction percentage
         current_results = getattr(self.session, "cv_results", None) or []
@@ -2762,14 +3049,19 @@ class RunTab(QWidget):
             n_contracted = sum(1 for res in current_results if hasattr(res, 'state') and res.state == "CONTRACTED")
             contracted_pct = (n_contracted / len(current_results)) * 100.0
 
-        try:
-            self.counters.setText(
-                f"Taps: {self.session.taps} | Contraction %: {contracted_pct:.1f}% | "
-                f"Elapsed: {elapsed:.1f} s | "
-                f"Rate10: {rate10_str} /min | Overall: {overall:.1f} /min"
-            )
-        except Exception:
-            pass
+        counters_text = _COUNTERS_FMT.format_map({
+            "taps": self.session.taps,
+            "contracted_pct": contracted_pct,
+            "elapsed": elapsed,
+            "rate10": rate10_str,
+            "overall": overall,
+        })
+        if counters_text != self._last_counters_text:
+            self._last_counters_text = counters_text
+            try:
+                self.counters.setText(counters_text)
+            except Exception:
+                pass
 
     def _check_disk_write_errors(self):
         if not self._hardware_run_active:
@@ -3073,8 +3365,7 @@ class RunTab(QWidget):
         }
         try:
             out_path = Path(self.session.run_dir) / "diagnostics_summary.json"
-            with out_path.open("w", encoding="utf-8") as fh:
-                json.dump(summary, fh, indent=2)
+            out_path.write_text(json.dumps(summary, indent=2), encoding="utf-8")
         except Exception:
             pass
 
@@ -3165,11 +3456,10 @@ class RunTab(QWidget):
             tracking_bytes = fps_est * avg_rows_per_frame * tracking_row_bytes * duration_s
             frame_bytes = fps_est * frame_row_bytes * duration_s
             tap_rate = 0.0
-            mode_label = self.mode.currentText().strip()
-            if mode_label.lower() == "periodic":
+            if self._mode_is_periodic:
                 period = max(0.001, float(self.period_sec.value()))
                 tap_rate = 1.0 / period
-            elif mode_label.lower() == "poisson":
+            else:
                 tap_rate = float(self.lambda_rpm.value()) / 60.0
             taps_bytes = tap_rate * tap_row_bytes * duration_s
             total_bytes = video_bytes + tracking_bytes + frame_bytes + taps_bytes
@@ -3407,7 +3697,8 @@ class RunTab(QWidget):
             self._run_lock_prev_enabled = {}
 
     def _on_stepsize_changed(self, text: str):
-        step = self._selected_stepsize()
+        step = self._selected_stepsize(text)
+        self._stepsize_choice = step
         if step is None:
             return
         self.current_stepsize = step
@@ -3583,7 +3874,7 @@ class RunTab(QWidget):
 
     def _make_run_id(self) -> str:
         ts = time.strftime("%Y%m%d_%H%M%S")
-        token = uuid.uuid4().hex[:RUN_ID_TOKEN_LEN].upper()
+        token = secrets.token_hex(RUN_ID_TOKEN_LEN // 2).upper()
         return f"run_{ts}_{token}"
 
     def _create_run_dir(self, base_dir: Path) -> tuple[Path, str]:
@@ -3645,8 +3936,8 @@ class RunTab(QWidget):
             "cv_config": cv_cfg,
         }
         try:
-            with (run_dir / "run.json").open("w", encoding="utf-8") as fh:
-                json.dump(data, fh, indent=2)
+            # Serialize up front so the file gets one write instead of one per token
+            (run_dir / "run.json").write_text(json.dumps(data, indent=2), encoding="utf-8")
         except Exception:
             pass
 
@@ -3661,8 +3952,7 @@ class RunTab(QWidget):
                 data = {}
         data.update(updates)
         try:
-            with meta_path.open("w", encoding="utf-8") as fh:
-                json.dump(data, fh, indent=2)
+            meta_path.write_text(json.dumps(data, indent=2), encoding="utf-8")
         except Exception:
             pass
 
@@ -3675,8 +3965,8 @@ class RunTab(QWidget):
                 "mode": mode,
                 "mark": mark,
                 "stepsize": self._selected_stepsize() or self.current_stepsize,
-                "preview_frame_idx": getattr(self, "_preview_frame_counter", None),
-                "recorded_frame_idx": getattr(self, "_recorded_frame_counter", None),
+                "preview_frame_idx": self._preview_frame_counter,
+                "recorded_frame_idx": self._recorded_frame_counter,
             }
         )
 
@@ -3691,8 +3981,8 @@ class RunTab(QWidget):
                 "mode": "Hardware",
                 "mark": "hardware",
                 "stepsize": self._selected_stepsize() or self.current_stepsize,
-                "preview_frame_idx": getattr(self, "_preview_frame_counter", None),
-                "recorded_frame_idx": getattr(self, "_recorded_frame_counter", None),
+                "preview_frame_idx": self._preview_frame_counter,
+                "recorded_frame_idx": self._recorded_frame_counter,
             }
         host_time = host_time_s or entry.get("host_time_s") or time.monotonic()
         if self.session.run_start is None:
@@ -3764,7 +4054,7 @@ class RunTab(QWidget):
         if self._next_tap_delay_s is None:
             return
         try:
-            self.serial_status.setText(f"Next tap in {self._next_tap_delay_s:.1f}s")
+            self._set_serial_status(f"Next tap in {self._next_tap_delay_s:.1f}s")
         except Exception:
             pass
 
@@ -3881,12 +4171,10 @@ class RunTab(QWidget):
         first_delay_s: float | None = None
         warmup_s = max(0.0, float(self.warmup_sec.value()))
 
-        mode_label = "Periodic"
         if self.session.replicant_ready:
             mode_label = "Replicant"
         else:
-            mode_text = self.mode.currentText().strip()
-            mode_label = mode_text or "Periodic"
+            mode_label = "Periodic" if self._mode_is_periodic else "Poisson"
 
         if not hardware_controlled:
             if self.session.replicant_ready:
@@ -3897,15 +4185,17 @@ class RunTab(QWidget):
                 stepsize = self._selected_stepsize() or self.current_stepsize or DEFAULT_STEPSIZE
                 self._send_hardware_config("H", stepsize, float(self.session.replicant_total), awaiting_switch=False)
             else:
-                if mode_label.lower() == "poisson":
-                    self.session.scheduler.configure_poisson(float(self.lambda_rpm.value()))
+                # Read the spin box once; the scheduler and the firmware config share it
+                if self._mode_is_periodic:
+                    mode_char = "P"
+                    value = float(self.period_sec.value())
+                    self.session.scheduler.configure_periodic(value)
                 else:
-                    self.session.scheduler.configure_periodic(float(self.period_sec.value()))
+                    mode_char = "R"
+                    value = float(self.lambda_rpm.value())
+                    self.session.scheduler.configure_poisson(value)
                 stepsize = self._selected_stepsize() or self.current_stepsize or DEFAULT_STEPSIZE
-                if mode_label.lower() == "poisson":
-                    self._send_hardware_config("R", stepsize, float(self.lambda_rpm.value()), awaiting_switch=False)
-                else:
-                    self._send_hardware_config("P", stepsize, float(self.period_sec.value()), awaiting_switch=False)
+                self._send_hardware_config(mode_char, stepsize, value, awaiting_switch=False)
         else:
             self.session.replicant_running = False
             self.session.replicant_index = 0
@@ -3968,7 +4258,7 @@ class RunTab(QWidget):
             delay_msg = f"Host run armed. First tap {delay_label} - do not flip switch."
             status_msg = f"{status_msg} {delay_msg}"
             try:
-                self.serial_status.setText(delay_msg)
+                self._set_serial_status(delay_msg)
             except Exception:
                 pass
         if not relocated_ok:
@@ -4064,12 +4354,18 @@ class RunTab(QWidget):
         else:
             self._update_status("Run stopped.")
 
+    _TAP_STATUS_LABELS = {
+        "Periodic": "Periodic tap",
+        "Poisson": "Poisson tap",
+        "Replicant": "Replicant tap",
+    }
+
     def _on_tap_due(self):
         if not self._hardware_run_active or not self._run_controlled_by_host:
             return
             
         # 1. Execute the Tap (Send Command)
-        mode_label = self.mode.currentText().strip() or "Periodic"
+        mode_label = "Periodic" if self._mode_is_periodic else "Poisson"
         mark = "scheduled"
         
         if self.session.replicant_running:
@@ -4079,7 +4375,7 @@ class RunTab(QWidget):
                 return
             
         self._queue_pending_tap(mode_label, mark)
-        sent = self._send_serial_char("t", f"{mode_label} tap")
+        sent = self._send_serial_char("t", self._TAP_STATUS_LABELS[mode_label])
         if not sent:
             self._log_pending_tap(None)
 
@@ -4170,7 +4466,7 @@ class RunTab(QWidget):
         ok = self.serial.send_char(ch)
         if ok:
             if label:
-                self.serial_status.setText(f"Last serial command: {label}")
+                self._set_serial_status(f"Last serial command: {label}")
             if ch == "e":
                 self._motor_enabled = True
             elif ch == "d":
@@ -4191,7 +4487,6 @@ class RunTab(QWidget):
                 self.serial.close()
             except Exception:
                 pass
-            self.serial_timer.stop()
             if self._resource_registry and self._active_serial_port:
                 self._resource_registry.release_serial(self, self._active_serial_port)
             self.session.active_serial_port = ""
@@ -4216,7 +4511,6 @@ class RunTab(QWidget):
             if self._resource_registry:
                 self._resource_registry.release_serial(self, port)
             return
-        self.serial_timer.start()
         self._reset_serial_indicator("waiting")
 
     def _open_camera(self):
@@ -4282,7 +4576,88 @@ class RunTab(QWidget):
         return {}
 
     # Frame loop
+    def _frame_stream_preview_only(self) -> bool:
+        # Recording, calibration and run logging need every captured frame
+        return (
+            self.recorder is None
+            and not self._disk_calib_active
+            and self.session.frame_logger is None
+        )
+
+    def _host_window(self) -> QWidget:
+        # The tab lives inside graphics-proxy content; climb out to the real top-level
+        window = self.window()
+        proxy = window.graphicsProxyWidget()
+        while proxy is not None:
+            views = proxy.scene().views() if proxy.scene() is not None else []
+            if not views:
+                break
+            window = views[0].window()
+            proxy = window.graphicsProxyWidget()
+        return window
+
+    def _preview_visible(self) -> bool:
+        pip = self._pip_window
+        if pip is not None and pip.isVisible():
+            return True
+        # isVisible() follows the tab page; the video view's own flag does not
+        if not self.isVisible() or not self.video_view.isVisibleTo(self):
+            return False
+        return not self._host_window().isMinimized()
+
+    def _update_frame_interval(self):
+        worker = getattr(self, "_frame_worker", None)
+        if worker is None:
+            return
+        interval = int(MS_PER_SEC / max(1, self.preview_fps))
+        if self._frame_stream_preview_only():
+            window = self._host_window()
+            if window is not None and (window.isMinimized() or not window.isActiveWindow()):
+                interval = max(interval, BACKGROUND_FRAME_INTERVAL_MS)
+        worker.set_interval(interval)
+
+    def changeEvent(self, event):
+        super().changeEvent(event)
+        if event.type() in (QEvent.ActivationChange, QEvent.WindowStateChange):
+            self._update_frame_interval()
+
+    def _reset_preview_backpressure(self):
+        self._rec_queue_ema = 0.0
+        self._preview_stride = 1
+        self._preview_stride_since = time.monotonic()
+
+    def _update_preview_backpressure(self, recorder, now: float):
+        """Thin out preview frames while the encoder queue stays saturated.
+
+        Recording still sees every frame; only the render submissions are
+        strided, stepping by one each PREVIEW_BACKPRESSURE_HOLD_S the queue
+        stays above (or below) the thresholds.
+        """
+        qmax = recorder.queue_max()
+        fill = recorder.queue_size() / qmax if qmax > 0 else 0.0
+        ema = self._rec_queue_ema + PREVIEW_BACKPRESSURE_EMA_ALPHA * (fill - self._rec_queue_ema)
+        self._rec_queue_ema = ema
+        if PREVIEW_BACKPRESSURE_LOW <= ema <= PREVIEW_BACKPRESSURE_HIGH:
+            self._preview_stride_since = now
+            return
+        if now - self._preview_stride_since < PREVIEW_BACKPRESSURE_HOLD_S:
+            return
+        self._preview_stride_since = now
+        if ema > PREVIEW_BACKPRESSURE_HIGH:
+            self._preview_stride = min(PREVIEW_STRIDE_MAX, self._preview_stride + 1)
+        else:
+            self._preview_stride = max(1, self._preview_stride - 1)
+
     def _handle_frame(self, frame, frame_idx, timestamp):
+        worker = self._frame_worker
+        if worker is not None:
+            # Preview alone can skip late frames and poll slower in the background
+            preview_only = self._frame_stream_preview_only()
+            if preview_only != self._frame_stream_was_preview_only:
+                self._frame_stream_was_preview_only = preview_only
+                worker.set_drop_late(preview_only)
+                self._update_frame_interval()
+            worker.frame_consumed()
         if self.cap is None or frame is None:
             return
         
@@ -4298,16 +4673,26 @@ class RunTab(QWidget):
                 pass
         # Frame arrives as BGR from FrameWorker (Zero-Copy)
         bgr = frame 
+        recorder = self.recorder
+        if recorder:
+            self._update_preview_backpressure(recorder, self._last_frame_ts)
+        elif self._preview_stride != 1:
+            self._reset_preview_backpressure()
         
-        # Submit to Render Worker for Composition (Off-Thread)
-        # We pass the CURRENT known mask.
-        mask = getattr(self.session, "cv_mask", None)
-        
-        # Only draw overlay if enabled
-        if hasattr(self, "show_cv_check") and not self.show_cv_check.isChecked():
-            mask = None
+        if self._preview_visible() and frame_idx % self._preview_stride == 0:
+            # Submit to Render Worker for Composition (Off-Thread)
+            # We pass the CURRENT known mask.
+            mask = getattr(self.session, "cv_mask", None)
             
-        self.render_worker.submit_frame(bgr, mask, frame_idx)
+            # Only draw overlay if enabled
+            if hasattr(self, "show_cv_check") and not self.show_cv_check.isChecked():
+                mask = None
+                
+            self.render_worker.submit_frame(bgr, mask, frame_idx)
+        else:
+            # Nothing on screen to show it; keep the index taps are logged against
+            self._preview_frame_counter = frame_idx
+            self.session.preview_frame_counter = frame_idx
         if self.session.frame_logger:
             try:
                 self.session.frame_logger.log_frame(frame_idx, timestamp)
@@ -4315,14 +4700,16 @@ class RunTab(QWidget):
                 pass
 
         # Recording (Direct BGR Write - Fast)
-        if self.recorder:
+        if recorder:
             self._recorded_frame_counter = frame_idx
             self.session.recorded_frame_counter = frame_idx
-            self.recorder.write(bgr)
+            recorder.write(bgr)
 
     def _on_render_ready(self, qimage, frame_idx):
         """Called when RenderWorker finishes composing the frame + overlay."""
         pix = QPixmap.fromImage(qimage)
+        # The pixmap owns a copy now; the worker may reuse the image's buffer
+        self.render_worker.image_consumed()
         
         self._preview_frame_counter = frame_idx
         self.session.preview_frame_counter = frame_idx
@@ -4331,7 +4718,7 @@ class RunTab(QWidget):
             self._maybe_update_preview_aspect(pix.width(), pix.height())
             
         self.video_view.set_image(pix)
-        if self._pip_window:
+        if self._pip_window and self._pip_window.isVisible():
             self._pip_window.set_pixmap(pix)
 
     def _on_cv_results(self, results, frame_idx, timestamp, mask):
@@ -4369,6 +4756,8 @@ class RunTab(QWidget):
         if self.cap is None or self._frame_worker is not None:
             return
         interval = int(MS_PER_SEC / max(1, self.preview_fps))
+        # Capture reads run on the worker's own thread; every signal below is
+        # queued so a slow camera never blocks the GUI event loop.
         self._frame_worker = FrameWorker(self.cap, interval)
         
         # 1. Start CV process once SHM is allocated
@@ -4387,6 +4776,8 @@ class RunTab(QWidget):
         
         self._last_frame_ts = time.monotonic()
         self._camera_dead = False
+        self._frame_stream_was_preview_only = None
+        self._reset_preview_backpressure()
         self._watchdog_timer.start()
         self._frame_worker.start()
 
@@ -4402,7 +4793,8 @@ class RunTab(QWidget):
     def _stop_frame_stream(self):
         worker = self._frame_worker
         if worker:
-            worker.stop()
+            if not worker.stop():
+                APP_LOGGER.warning("Frame capture thread did not exit before timeout; it will finish in the background.")
         self._cleanup_frame_stream()
 
     def _cleanup_frame_stream(self):
@@ -4482,7 +4874,7 @@ class RunTab(QWidget):
             except Exception:
                 pass
             self._reset_serial_indicator("disconnected")
-        self.serial_timer.stop()
+        self.serial.set_rx_callback(None)
         self._hardware_run_active = False
         self._awaiting_switch_start = False
         self._hardware_configured = False
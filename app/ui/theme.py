@@ -1,5 +1,6 @@
 # app/ui/theme.py
 import sys
+import functools
 from PySide6.QtGui import QColor
 from PySide6.QtWidgets import QWidget
 from app.core.logger import APP_LOGGER
@@ -94,9 +95,20 @@ def set_active_theme(name: str) -> dict[str, str]:
     return active_theme()
 
 def build_stylesheet(font_family: str | None, scale: float = 1.0, theme: dict = None) -> str:
+    """Application stylesheet; built-in themes are memoised per (theme, font, scale)."""
     if theme is None:
-        theme = active_theme()
-    
+        return _build_stylesheet_cached(font_family, float(scale), _ACTIVE_THEME_NAME)
+    for name, candidate in THEMES.items():
+        if candidate is theme:
+            return _build_stylesheet_cached(font_family, float(scale), name)
+    return _format_stylesheet(font_family, scale, theme)
+
+@functools.lru_cache(maxsize=16)
+def _build_stylesheet_cached(font_family: str | None, scale: float, theme_name: str) -> str:
+    # THEMES is never mutated at runtime; call cache_clear() if that changes
+    return _format_stylesheet(font_family, scale, THEMES[theme_name])
+
+def _format_stylesheet(font_family: str | None, scale: float, theme: dict) -> str:
     # Extract colors for local use in f-string
     bg = theme["BG"]
     mid = theme["MID"]
@@ -108,6 +120,8 @@ def build_stylesheet(font_family: str | None, scale: float = 1.0, theme: dict =
     dis_bg = theme["DISABLED_BG"]
     dis_text = theme["DISABLED_TEXT"]
     dis_border = theme["DISABLED_BORDER"]
+    subtxt = theme["SUBTXT"]
+    danger = theme["DANGER"]
 
     s = max(UI_SCALE_MIN, min(scale, UI_SCALE_MAX))
     family_rule = f"font-family: '{font_family}';" if font_family else ""
@@ -126,6 +140,11 @@ def build_stylesheet(font_family: str | None, scale: float = 1.0, theme: dict =
 * {{ background: {bg}; color: {text}; font-size: {font_pt}pt; {family_rule} }}
 QWidget {{ background: {bg}; }}
 QLabel#StatusLine {{ color: {text}; font-size: {status_pt}pt; }}
+QLabel#LogoFooter {{ color: {accent}; font-size: 16pt; font-weight: bold; }}
+QLabel#LogoTagline {{ color: {text}; font-size: 10pt; font-weight: normal; }}
+QLabel#ReplicantStatus {{ color: {subtxt}; }}
+QLabel#RecIndicator {{ color: {subtxt}; }}
+QLabel#RecIndicator[recording="true"] {{ color: {danger}; font-weight: bold; }}
 QPushButton {{ background: {mid}; border:1px solid {btn_border}; padding:{btn_py}px {btn_px}px; border-radius:0px; }}
 QPushButton:hover {{ border-color: {accent}; }}
 QPushButton:checked {{ background:{btn_checked}; border-color:{accent}; }}
@@ -246,22 +265,29 @@ def set_macos_titlebar_appearance(widget: QWidget, color: QColor) -> bool:
     return True
 
 HEATMAP_PALETTES = ("inferno", "magma", "cividis", "plasma", "viridis", "turbo")
+# Typestar is registered with Matplotlib once; its resolved family name is
+# kept here. The last applied (family, colours) key skips redundant updates.
+_MPL_FONT_RESOLVED = False
+_MPL_FONT_FAMILY: str | None = None
+_MPL_THEME_KEY: tuple | None = None
 
 def apply_matplotlib_theme(font_family: str | None, theme: dict[str, str]):
     """Make Matplotlib match the NEMESIS UI theme."""
+    global _MPL_FONT_RESOLVED, _MPL_FONT_FAMILY, _MPL_THEME_KEY
     import matplotlib as mpl
-    from matplotlib import font_manager
-    from app.core.paths import FONT_PATH
-    
-    mpl_family = None
-    try:
-        if FONT_PATH.exists():
-            font_manager.fontManager.addfont(str(FONT_PATH))
-            mpl_family = font_manager.FontProperties(fname=str(FONT_PATH)).get_name()
-    except Exception:
-        mpl_family = None
+
+    if not _MPL_FONT_RESOLVED:
+        from matplotlib import font_manager
+        from app.core.paths import FONT_PATH
+        _MPL_FONT_RESOLVED = True
+        try:
+            if FONT_PATH.exists():
+                font_manager.fontManager.addfont(str(FONT_PATH))
+                _MPL_FONT_FAMILY = font_manager.FontProperties(fname=str(FONT_PATH)).get_name()
+        except Exception:
+            _MPL_FONT_FAMILY = None
     # Prefer the actual family name discovered by Matplotlib for the Typestar file
-    family = mpl_family or font_family or "DejaVu Sans"
+    family = _MPL_FONT_FAMILY or font_family or "DejaVu Sans"
     base_size = PLOT_BASE_FONT_PT
     tick_size = max(8, base_size - 1)
     
@@ -270,7 +296,11 @@ def apply_matplotlib_theme(font_family: str | None, theme: dict[str, str]):
     face = theme.get("PLOT_FACE", mid)
     text_color = theme.get("TEXT", "#1d2334")
     grid_color = theme.get("GRID", "#cdd5e5")
-    
+
+    key = (family, face, text_color, grid_color)
+    if key == _MPL_THEME_KEY:
+        return
+    _MPL_THEME_KEY = key
     mpl.rcParams.update({
         "font.family": [family],
         "font.sans-serif": [family, "DejaVu Sans", "Arial"],
@@ -286,7 +316,8 @@ def apply_matplotlib_theme(font_family: str | None, theme: dict[str, str]):
         "xtick.color": text_color,
         "ytick.color": text_color,
         "text.color": text_color,
-        "figure.autolayout": True,
+        # LiveChart sets explicit margins; a tight_layout solve per draw would undo them
+        "figure.autolayout": False,
         "grid.color": grid_color,
         "grid.linestyle": ":",
         "grid.alpha": 0.8,
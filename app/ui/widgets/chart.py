@@ -4,7 +4,9 @@ import math
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
+from matplotlib.collections import EventCollection
 from matplotlib.ticker import MultipleLocator
+from PySide6.QtCore import QTimer
 from app.ui.theme import active_theme, HEATMAP_PALETTES
 from app.core.logger import APP_LOGGER
 
@@ -47,6 +49,8 @@ GRID_LINE_OFFSET = 0.5
 HEATMAP_GRID_LINEWIDTH = 0.35
 HEATMAP_GRID_ALPHA = 0.2
 DEFAULT_DPI = 300
+TAP_BUFFER_INITIAL = 1024
+LIVE_REDRAW_INTERVAL_MS = 50
 
 class LiveChart:
     PALETTES = HEATMAP_PALETTES
@@ -62,8 +66,18 @@ class LiveChart:
             gridspec_kw={"height_ratios": [1, 5]}
         )
         # Compact layout and tighter suptitle position to reduce top padding
+        # Minute-tick locators, built once; a locator binds to one axis, so
+        # each axes gets its own (top major, top minor, bottom major, bottom minor)
+        self._minute_locators = (
+            MultipleLocator(STANDARD_MAJOR_TICK_MIN),
+            MultipleLocator(STANDARD_MINOR_TICK_MIN),
+            MultipleLocator(STANDARD_MAJOR_TICK_MIN),
+            MultipleLocator(STANDARD_MINOR_TICK_MIN),
+        )
+        # Margins currently applied; subplots_adjust only runs when they change
+        self._subplot_params: dict | None = None
         try:
-            self.fig.subplots_adjust(**STANDARD_SUBPLOT_ADJUST)
+            self._apply_subplot_params(STANDARD_SUBPLOT_ADJUST)
         except Exception as e:
             APP_LOGGER.error(f"LiveChart subplots_adjust error: {e}")
             
@@ -75,7 +89,11 @@ class LiveChart:
             self.canvas.setStyleSheet("background: transparent;")
         except Exception as e:
             APP_LOGGER.error(f"Error setting canvas stylesheet: {e}")
-        self.times_sec: list[float] = []
+        # Tap times live in a growable float64 buffer; only the first
+        # _tap_count entries are valid (see the times_sec property)
+        self._tap_buf = np.empty(TAP_BUFFER_INITIAL, dtype=float)
+        self._tap_count = 0
+        self._tap_max_sec = 0.0
         self.contraction_times_sec: list[float] = []
         self._time_unit: str = "minutes"
         self._last_max_elapsed_sec: float = 0.0
@@ -90,6 +108,20 @@ class LiveChart:
         self._long_run_listeners: list[Callable[[bool], None]] = []
         self._long_run_view: str = "taps"
         self.contraction_heatmap: np.ndarray | None = None
+        # Data updates (taps, contractions, replay targets/progress, loaded times)
+        # redraw at most every LIVE_REDRAW_INTERVAL_MS; a burst costs one draw
+        self._redraw_timer = QTimer(self.canvas)
+        self._redraw_timer.setSingleShot(True)
+        self._redraw_timer.setInterval(LIVE_REDRAW_INTERVAL_MS)
+        self._redraw_timer.timeout.connect(self._redraw)
+        # Standard-mode rasters are persistent animated collections. While the
+        # axes layout is unchanged a redraw only moves their positions and
+        # blits them over the background captured after the last full draw.
+        self._standard_artists: dict[str, EventCollection] | None = None
+        self._standard_x_limit_min: float | None = None
+        self._blit_bg = None
+        self._saving = False
+        self.canvas.mpl_connect("draw_event", self._on_canvas_draw)
         self._init_axes()
 
     def _init_axes(self):
@@ -104,7 +136,9 @@ class LiveChart:
         self.canvas.draw_idle()
 
     def reset(self):
-        self.times_sec.clear()
+        self._redraw_timer.stop()
+        self._tap_count = 0
+        self._tap_max_sec = 0.0
         self.contraction_times_sec.clear()
         self.replay_completed = min(self.replay_completed, len(self.replay_targets))
         self._last_max_elapsed_sec = 0.0
@@ -116,22 +150,39 @@ class LiveChart:
         self._set_heatmap_state(False)
         self.canvas.draw_idle()
 
+    @property
+    def times_sec(self) -> np.ndarray:
+        return self._tap_buf[: self._tap_count]
+
     def add_tap(self, t_since_start_s: float):
-        self.times_sec.append(float(t_since_start_s))
-        self._redraw()
+        t = float(t_since_start_s)
+        n = self._tap_count
+        if n == self._tap_buf.shape[0]:
+            grown = np.empty(n * 2, dtype=float)
+            grown[:n] = self._tap_buf
+            self._tap_buf = grown
+        self._tap_buf[n] = t
+        self._tap_count = n + 1
+        if t > self._tap_max_sec:
+            self._tap_max_sec = t
+        self._schedule_redraw()
 
     def add_contraction(self, t_since_start_s: float):
         self.contraction_times_sec.append(float(t_since_start_s))
-        self._redraw()
+        self._schedule_redraw()
 
     def set_times(self, times_seconds: Sequence[float]):
-        self.times_sec = [float(v) for v in times_seconds]
-        self._redraw()
+        values = np.asarray(times_seconds, dtype=float).ravel()
+        self._tap_buf = np.empty(max(TAP_BUFFER_INITIAL, values.size), dtype=float)
+        self._tap_buf[: values.size] = values
+        self._tap_count = int(values.size)
+        self._tap_max_sec = float(values.max()) if values.size else 0.0
+        self._schedule_redraw()
 
     def set_replay_targets(self, targets: Sequence[float] | None):
         self.replay_targets = [] if targets is None else [float(v) for v in targets]
         self.replay_completed = 0
-        self._redraw()
+        self._schedule_redraw()
 
     def mark_replay_progress(self, completed: int):
         if completed < 0:
@@ -139,12 +190,12 @@ class LiveChart:
         if completed > len(self.replay_targets):
             completed = len(self.replay_targets)
         self.replay_completed = completed
-        self._redraw()
+        self._schedule_redraw()
 
     def clear_replay_targets(self):
         self.replay_targets = []
         self.replay_completed = 0
-        self._redraw()
+        self._schedule_redraw()
 
     def set_contraction_heatmap(self, matrix: Sequence[Sequence[float]] | None):
         if matrix is None:
@@ -156,7 +207,7 @@ class LiveChart:
             else:
                 self.contraction_heatmap = arr
         if self._long_run_view == "contraction" and self._long_run_active:
-            self._redraw()
+            self._schedule_redraw()
 
     def set_long_run_view(self, view: str):
         view_key = (view or "").strip().lower()
@@ -200,13 +251,18 @@ class LiveChart:
             except Exception:
                 continue
 
+    def _schedule_redraw(self):
+        if not self._redraw_timer.isActive():
+            self._redraw_timer.start()
+
     def _redraw(self):
-        max_elapsed_sec_actual = max(self.times_sec) if self.times_sec else 0.0
+        self._redraw_timer.stop()
+        max_elapsed_sec_actual = self._tap_max_sec if self._tap_count else 0.0
         max_elapsed_sec_contractions = max(self.contraction_times_sec) if self.contraction_times_sec else 0.0
         max_elapsed_sec_script = max(self.replay_targets) if self.replay_targets else 0.0
         max_elapsed_sec = max(max_elapsed_sec_actual, max_elapsed_sec_script, max_elapsed_sec_contractions)
         
-        has_any_data = bool(self.times_sec or self.contraction_times_sec or self.replay_targets)
+        has_any_data = bool(self._tap_count or self.contraction_times_sec or self.replay_targets)
 
         if not has_any_data:
             self._configure_standard_axes(0.0)
@@ -226,13 +282,85 @@ class LiveChart:
                 self._configure_long_raster_axes(max_elapsed_sec)
                 self._draw_long_raster(max_elapsed_sec)
         else:
-            self._configure_standard_axes(max_elapsed_sec)
+            # The x-limit moves in whole major-tick steps, so the blitted
+            # background stays valid until the run crosses the next step
+            layout_changed = (
+                self._standard_artists is None
+                or self._standard_x_limit(max_elapsed_sec) != self._standard_x_limit_min
+            )
+            if layout_changed:
+                self._configure_standard_axes(max_elapsed_sec)
+            else:
+                self._last_max_elapsed_sec = max_elapsed_sec
             self._draw_standard_raster()
+            if not layout_changed:
+                self._blit_standard()
+                return
 
         self._set_long_mode(long_mode)
         self._set_heatmap_state(heatmap_on)
         self.canvas.draw_idle()
 
+    def _apply_subplot_params(self, params: dict) -> None:
+        if params is self._subplot_params:
+            return
+        self.fig.subplots_adjust(**params)
+        self._subplot_params = params
+
+    def _standard_x_limit(self, max_elapsed_sec: float) -> float:
+        minutes_span = max_elapsed_sec / SECONDS_PER_MIN if max_elapsed_sec else 0.0
+        default_limit = STANDARD_X_LIMIT_DEFAULT_MIN
+        target_limit = minutes_span * STANDARD_X_LIMIT_MARGIN if minutes_span else default_limit
+        # Round up to a major tick so the axes only change every few minutes
+        target_limit = math.ceil(target_limit / STANDARD_MAJOR_TICK_MIN) * STANDARD_MAJOR_TICK_MIN
+        return max(default_limit, min(STANDARD_X_LIMIT_MAX_MIN, target_limit))
+
+    def _create_standard_artists(self) -> None:
+        text_color = self.color("TEXT")
+        accent_color = self.color("ACCENT")
+        specs = (
+            ("remaining", self.ax_top, self.color("SUBTXT"), 0.8, TAP_LINE_OFFSET, TAP_LINE_LENGTH),
+            ("completed", self.ax_top, accent_color, 1.0, TAP_LINE_OFFSET, TAP_LINE_LENGTH),
+            ("regular", self.ax_top, text_color, 0.9, TAP_LINE_OFFSET, TAP_LINE_LENGTH),
+            ("highlighted", self.ax_top, accent_color, 1.6, TAP_LINE_OFFSET, TAP_LINE_LENGTH),
+            ("contraction", self.ax_bot, self.color("DANGER"), CONTRACTION_LINEWIDTH,
+             CONTRACTION_LINE_OFFSET, CONTRACTION_LINE_LENGTH),
+        )
+        artists = {}
+        for name, ax, color, linewidth, offset, length in specs:
+            coll = EventCollection(
+                [],
+                orientation="horizontal",
+                lineoffset=offset,
+                linelength=length,
+                linewidth=linewidth,
+                color=color,
+            )
+            coll.set_animated(True)
+            ax.add_collection(coll, autolim=False)
+            artists[name] = coll
+        self._standard_artists = artists
+
+    def _draw_standard_artists(self) -> None:
+        for coll in self._standard_artists.values():
+            coll.axes.draw_artist(coll)
+
+    def _on_canvas_draw(self, event) -> None:
+        if self._saving or self._standard_artists is None:
+            self._blit_bg = None
+            return
+        # Background without the animated rasters, then the rasters on top
+        self._blit_bg = self.canvas.copy_from_bbox(self.fig.bbox)
+        self._draw_standard_artists()
+
+    def _blit_standard(self) -> None:
+        if self._blit_bg is None:
+            self.canvas.draw_idle()
+            return
+        self.canvas.restore_region(self._blit_bg)
+        self._draw_standard_artists()
+        self.canvas.blit(self.fig.bbox)
+
     def _configure_standard_axes(self, max_elapsed_sec: float) -> None:
         text_color = self.color("TEXT")
         ax_top = self.ax_top
@@ -240,6 +368,7 @@ class LiveChart:
 
         ax_top.cla()
         ax_bot.cla()
+        self._blit_bg = None
         try:
             ax_top.set_facecolor('none')
             ax_bot.set_facecolor('none')
@@ -267,17 +396,13 @@ class LiveChart:
             spine.set_color(text_color)
         ax_bot.set_title("")
 
-        minutes_span = max_elapsed_sec / SECONDS_PER_MIN if max_elapsed_sec else 0.0
-        default_limit = STANDARD_X_LIMIT_DEFAULT_MIN
-        target_limit = minutes_span * STANDARD_X_LIMIT_MARGIN if minutes_span else default_limit
-        max_unit_val = max(default_limit, min(STANDARD_X_LIMIT_MAX_MIN, target_limit))
-
-        major = MultipleLocator(STANDARD_MAJOR_TICK_MIN)
-        minor = MultipleLocator(STANDARD_MINOR_TICK_MIN)
-        ax_top.xaxis.set_major_locator(major)
-        ax_top.xaxis.set_minor_locator(minor)
-        ax_bot.xaxis.set_major_locator(MultipleLocator(STANDARD_MAJOR_TICK_MIN))
-        ax_bot.xaxis.set_minor_locator(MultipleLocator(STANDARD_MINOR_TICK_MIN))
+        max_unit_val = self._standard_x_limit(max_elapsed_sec)
+
+        top_major, top_minor, bot_major, bot_minor = self._minute_locators
+        ax_top.xaxis.set_major_locator(top_major)
+        ax_top.xaxis.set_minor_locator(top_minor)
+        ax_bot.xaxis.set_major_locator(bot_major)
+        ax_bot.xaxis.set_minor_locator(bot_minor)
         ax_bot.set_xlabel("Time (minutes)")
         ax_top.grid(True, which="major", axis="x", linestyle=":", alpha=GRID_ALPHA_MAJOR)
         ax_top.grid(True, which="minor", axis="x", linestyle=":", alpha=GRID_ALPHA_MINOR)
@@ -286,10 +411,12 @@ class LiveChart:
 
         ax_top.set_xlim(0, max_unit_val)
         ax_bot.set_xlim(0, max_unit_val)
+        self._create_standard_artists()
+        self._standard_x_limit_min = max_unit_val
         self._time_unit = "minutes"
         self._last_max_elapsed_sec = max_elapsed_sec
         try:
-            self.fig.subplots_adjust(**STANDARD_SUBPLOT_ADJUST)
+            self._apply_subplot_params(STANDARD_SUBPLOT_ADJUST)
             self.fig.suptitle("Stentor Habituation to Stimuli", fontsize=TITLE_FONT_SIZE, color=text_color, y=TITLE_Y_STANDARD)
         except Exception as e:
             APP_LOGGER.error(f"Error adjusting subplots or suptitle: {e}")
@@ -301,6 +428,8 @@ class LiveChart:
 
         ax_top.cla()
         ax_bot.cla()
+        self._standard_artists = None
+        self._blit_bg = None
         try:
             ax_top.set_facecolor('none')
             ax_bot.set_facecolor('none')
@@ -322,7 +451,7 @@ class LiveChart:
         self._time_unit = "hours"
         self._last_max_elapsed_sec = max_elapsed_sec
         try:
-            self.fig.subplots_adjust(**LONG_SUBPLOT_ADJUST)
+            self._apply_subplot_params(LONG_SUBPLOT_ADJUST)
             self.fig.suptitle("Tap raster by hour", fontsize=TITLE_FONT_SIZE, color=text_color, y=TITLE_Y_LONG)
         except Exception as e:
             APP_LOGGER.error(f"Error adjusting subplots (long raster): {e}")
@@ -334,6 +463,8 @@ class LiveChart:
 
         ax_top.cla()
         ax_bot.cla()
+        self._standard_artists = None
+        self._blit_bg = None
         try:
             ax_top.set_facecolor('none')
             ax_bot.set_facecolor('none')
@@ -351,73 +482,26 @@ class LiveChart:
 
         self._time_unit = "hours"
         try:
-            self.fig.subplots_adjust(**LONG_HEATMAP_SUBPLOT_ADJUST)
+            self._apply_subplot_params(LONG_HEATMAP_SUBPLOT_ADJUST)
             self.fig.suptitle("Contraction heatmap", fontsize=TITLE_FONT_SIZE, color=text_color, y=TITLE_Y_LONG)
         except Exception as e:
             APP_LOGGER.error(f"Error adjusting subplots (long heatmap): {e}")
 
     def _draw_standard_raster(self) -> None:
-        text_color = self.color("TEXT")
-        accent_color = self.color("ACCENT")
-        remaining_color = self.color("SUBTXT")
-        contraction_color = self.color("DANGER")
-
         factor = SECONDS_PER_MIN
-        ts_unit = [t / factor for t in self.times_sec]
-        highlighted = [t for i, t in enumerate(ts_unit) if (i + 1) % HIGHLIGHT_EVERY == 0]
-        regular = [t for i, t in enumerate(ts_unit) if (i + 1) % HIGHLIGHT_EVERY != 0]
-        contraction_unit = [t / factor for t in self.contraction_times_sec]
-
-        if self.replay_targets:
-            replay_unit = [t / factor for t in self.replay_targets]
-            completed_unit = replay_unit[: self.replay_completed]
-            remaining_unit = replay_unit[self.replay_completed :]
-            if remaining_unit:
-                self.ax_top.eventplot(
-                    remaining_unit,
-                    orientation="horizontal",
-                    colors=remaining_color,
-                    linewidth=0.8,
-                    lineoffsets=TAP_LINE_OFFSET,
-                    linelengths=TAP_LINE_LENGTH,
-                )
-            if completed_unit and not self.times_sec:
-                self.ax_top.eventplot(
-                    completed_unit,
-                    orientation="horizontal",
-                    colors=accent_color,
-                    linewidth=1.0,
-                    lineoffsets=TAP_LINE_OFFSET,
-                    linelengths=TAP_LINE_LENGTH,
-                )
-
-        if regular:
-            self.ax_top.eventplot(
-                regular,
-                orientation="horizontal",
-                colors=text_color,
-                linewidth=0.9,
-                lineoffsets=TAP_LINE_OFFSET,
-                linelengths=TAP_LINE_LENGTH,
-            )
-        if highlighted:
-            self.ax_top.eventplot(
-                highlighted,
-                orientation="horizontal",
-                colors=accent_color,
-                linewidth=1.6,
-                lineoffsets=TAP_LINE_OFFSET,
-                linelengths=TAP_LINE_LENGTH,
-            )
-        if contraction_unit:
-            self.ax_bot.eventplot(
-                contraction_unit,
-                orientation="horizontal",
-                colors=contraction_color,
-                linewidth=CONTRACTION_LINEWIDTH,
-                lineoffsets=CONTRACTION_LINE_OFFSET,
-                linelengths=CONTRACTION_LINE_LENGTH,
-            )
+        ts_unit = self.times_sec / factor
+        is_highlight = (np.arange(1, ts_unit.size + 1) % HIGHLIGHT_EVERY) == 0
+        replay_unit = np.asarray(self.replay_targets, dtype=float) / factor
+        completed_unit = replay_unit[: self.replay_completed]
+        if self._tap_count:
+            completed_unit = completed_unit[:0]
+
+        artists = self._standard_artists
+        artists["remaining"].set_positions(replay_unit[self.replay_completed :])
+        artists["completed"].set_positions(completed_unit)
+        artists["regular"].set_positions(ts_unit[~is_highlight])
+        artists["highlighted"].set_positions(ts_unit[is_highlight])
+        artists["contraction"].set_positions(np.asarray(self.contraction_times_sec, dtype=float) / factor)
 
     def _draw_long_raster(self, max_elapsed_sec: float) -> None:
         ax = self.ax_top
@@ -425,7 +509,7 @@ class LiveChart:
         accent_color = self.color("ACCENT")
         pending_color = self.color("SUBTXT")
 
-        taps_actual = np.asarray(self.times_sec, dtype=float)
+        taps_actual = self.times_sec
         taps_script = np.asarray(self.replay_targets, dtype=float) if self.replay_targets else np.empty(0, dtype=float)
 
         taps_actual = taps_actual[np.isfinite(taps_actual)]
@@ -572,6 +656,8 @@ class LiveChart:
         self._heatmap_im = img
         if self._heatmap_cbar is None:
             self._heatmap_cbar = self.fig.colorbar(img, ax=ax, pad=HEATMAP_CBAR_PAD, fraction=HEATMAP_CBAR_FRACTION)
+            # The colorbar shrinks the host axes; the next configure must reset it
+            self._subplot_params = None
         else:
             try:
                 self._heatmap_cbar.update_normal(img)
@@ -640,7 +726,19 @@ class LiveChart:
         return self._heatmap_active
 
     def save(self, path: str, dpi: int = DEFAULT_DPI) -> None:
-        self.fig.savefig(path, dpi=dpi, bbox_inches='tight')
+        if self._redraw_timer.isActive():
+            self._redraw()
+        # Animated artists are skipped by a normal draw; include them in the export
+        artists = list(self._standard_artists.values()) if self._standard_artists else []
+        self._saving = True
+        for coll in artists:
+            coll.set_animated(False)
+        try:
+            self.fig.savefig(path, dpi=dpi, bbox_inches='tight')
+        finally:
+            for coll in artists:
+                coll.set_animated(True)
+            self._saving = False
 
     def color(self, key: str) -> str:
         if key in self.theme:
@@ -651,7 +749,9 @@ class LiveChart:
         self.theme = theme
         from app.ui.theme import apply_matplotlib_theme
         apply_matplotlib_theme(self.font_family, theme)
-        if self.times_sec or self.replay_targets or self.contraction_times_sec:
+        # Raster colours are baked into the persistent artists; rebuild them
+        self._standard_artists = None
+        if self._tap_count or self.replay_targets or self.contraction_times_sec:
             self._redraw()
         else:
             if self._long_run_active:
@@ -1,7 +1,7 @@
 # app/ui/widgets/containers.py
 from PySide6.QtWidgets import QWidget, QSizePolicy, QTabBar, QStylePainter, QStyleOptionTab, QStyle
 from PySide6.QtCore import QSize, Qt, QRect
-from PySide6.QtGui import QIcon, QPalette
+from PySide6.QtGui import QIcon, QPalette, QRegion
 from app.ui.theme import BG, BORDER, active_theme
 
 DEFAULT_ASPECT_RATIO = (16, 9)
@@ -27,6 +27,9 @@ class AspectRatioContainer(QWidget):
         self._child = child
         self._ratio_w = max(1, int(ratio_w))
         self._ratio_h = max(1, int(ratio_h))
+        self._ratio = (self._ratio_w, self._ratio_h)
+        # Last heightForWidth answer: (w, min_h, ratio_w, ratio_h, result)
+        self._hfw_cache = (-1, -1, -1, -1, -1)
         self._child.setParent(self)
         # Tell the layout system we compute height from width.
         sp = QSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
@@ -36,6 +39,7 @@ class AspectRatioContainer(QWidget):
         self.setAttribute(Qt.WA_StyledBackground, True)
         self._border_px = CONTAINER_BORDER_PX
         self._show_border = True
+        self._last_qss = None
         self._apply_border_style()
         # Reasonable floor so it never collapses
         self.setMinimumSize(*CONTAINER_MIN_SIZE)
@@ -45,7 +49,14 @@ class AspectRatioContainer(QWidget):
         return True
 
     def heightForWidth(self, w: int) -> int:
-        return max(self.minimumHeight(), int(w * self._ratio_h / self._ratio_w))
+        # Layouts probe this repeatedly with the same width during a resize
+        min_h = self.minimumHeight()
+        cw, cmin, crw, crh, ch = self._hfw_cache
+        if cw == w and cmin == min_h and crw == self._ratio_w and crh == self._ratio_h:
+            return ch
+        h = max(min_h, int(w * self._ratio_h / self._ratio_w))
+        self._hfw_cache = (w, min_h, self._ratio_w, self._ratio_h, h)
+        return h
 
     def sizeHint(self) -> QSize:
         # Width-driven; height will be computed via heightForWidth
@@ -59,17 +70,24 @@ class AspectRatioContainer(QWidget):
             return
         if w > 0 and h > 0:
             self._ratio_w, self._ratio_h = w, h
+            self._ratio = (w, h)
+            self._hfw_cache = (-1, -1, -1, -1, -1)
             self.updateGeometry()
 
     def aspect_ratio(self) -> tuple[int, int]:
-        return self._ratio_w, self._ratio_h
+        return self._ratio
 
     def _apply_border_style(self, theme: dict[str, str] | None = None):
         palette = theme or active_theme()
         border_color = palette.get("BORDER", BORDER)
         bg = palette.get("BG", BG)
         border = f"{self._border_px}px solid {border_color}" if self._show_border else "none"
-        self.setStyleSheet(f"background: {bg}; border: {border};")
+        qss = f"background: {bg}; border: {border};"
+        # setStyleSheet re-polishes the subtree even for an identical string
+        if qss == self._last_qss:
+            return
+        self._last_qss = qss
+        self.setStyleSheet(qss)
 
     def set_border_visible(self, on: bool):
         self._show_border = bool(on)
@@ -79,7 +97,9 @@ class AspectRatioContainer(QWidget):
             self.updateGeometry()
         except Exception:
             pass
-        self.update()
+        self._fit_child()
+        # Only the border ring changes; the child repaints itself when moved
+        self.update(self._border_region())
 
     def set_theme(self, theme: dict[str, str]):
         self._apply_border_style(theme)
@@ -87,7 +107,12 @@ class AspectRatioContainer(QWidget):
     def border_visible(self) -> bool:
         return bool(getattr(self, "_show_border", True))
 
-    def resizeEvent(self, e):
+    def _border_region(self) -> QRegion:
+        outer = self.rect()
+        b = self._border_px
+        return QRegion(outer).subtracted(QRegion(outer.adjusted(b, b, -b, -b)))
+
+    def _fit_child(self):
         # Fit child to inner rect inside border; if border hidden, don't subtract it
         b = self._border_px if getattr(self, "_show_border", True) else 0
         outer_w = self.width(); outer_h = self.height()
@@ -101,6 +126,9 @@ class AspectRatioContainer(QWidget):
         x = b + (W - target_w) // 2
         y = b + (H - target_h) // 2
         self._child.setGeometry(x, y, target_w, target_h)
+
+    def resizeEvent(self, e):
+        self._fit_child()
         super().resizeEvent(e)
 
 
@@ -114,10 +142,16 @@ class LeftAlignTabBar(QTabBar):
 
     def paintEvent(self, event):
         painter = QStylePainter(self)
+        dirty = event.region()
+        painter.setClipRegion(dirty)
         for index in range(self.count()):
+            rect = self.tabRect(index)
+            # Hover/selection changes only dirty one or two tabs
+            if not dirty.intersects(rect):
+                continue
             opt = QStyleOptionTab()
             self.initStyleOption(opt, index)
-            opt.rect = self.tabRect(index)
+            opt.rect = rect
             painter.drawControl(QStyle.CE_TabBarTabShape, opt)
 
             text_rect = opt.rect.adjusted(TAB_TEXT_PADDING, 0, -TAB_TEXT_PADDING, 0)
@@ -1,10 +1,12 @@
 # app/ui/widgets/viewer.py
+import math
+import operator
 from PySide6.QtWidgets import (
     QWidget, QGraphicsView, QGraphicsScene, QGraphicsPixmapItem, 
-    QVBoxLayout, QGraphicsProxyWidget
+    QVBoxLayout, QGraphicsProxyWidget, QPinchGesture
 )
-from PySide6.QtCore import Qt, Signal, QSize, QTimer, QEvent
-from PySide6.QtGui import QPainter, QColor, QPixmap
+from PySide6.QtCore import Qt, Signal, QSize, QTimer, QEvent, QPointF, QRect
+from PySide6.QtGui import QPainter, QColor, QPixmap, QPixmapCache, QFontMetrics, QNativeGestureEvent
 from app.ui.theme import BG, SCROLLBAR, SUBTXT
 from app.core.logger import APP_LOGGER
 from .containers import AspectRatioContainer
@@ -19,6 +21,7 @@ ZOOM_EPS = 1e-3
 ZOOM_DELTA_EPS = 1e-6
 PLACEHOLDER_FONT_PT = 14
 PLACEHOLDER_TEXT = "Video Preview"
+PLACEHOLDER_PAD_PX = 2
 APP_ZOOM_MIN = 1.0
 APP_ZOOM_MAX = 1.35
 APP_ZOOM_EPS = 1e-3
@@ -29,13 +32,48 @@ CONTENT_FALLBACK_SIZE = (1200, 720)
 PREVIEW_ASPECT_RATIO = (16, 9)
 PINNED_PREVIEW_SIZE = (420, 236)
 
+# Only these event types reach the pinch handling in event(); everything else
+# goes straight to the base class
+_GESTURE_EVENT_TYPES = frozenset((QEvent.NativeGesture, QEvent.Gesture))
+
+def _gesture_accessor(cls, name: str):
+    # Bindings expose these either as methods or as properties; decide once at import
+    if callable(getattr(cls, name, None)):
+        return operator.methodcaller(name)
+    return operator.attrgetter(name)
+
+_GESTURE_TYPE = _gesture_accessor(QNativeGestureEvent, "gestureType")
+_GESTURE_VALUE = _gesture_accessor(QNativeGestureEvent, "value")
+_PINCH_SCALE = _gesture_accessor(QPinchGesture, "scaleFactor")
+
+# Scrollbar QSS keyed by handle color
+_SCROLLBAR_STYLE_CACHE: dict[str, str] = {}
+
+def _scrollbar_qss(color: str) -> str:
+    cached = _SCROLLBAR_STYLE_CACHE.get(color)
+    if cached is not None:
+        return cached
+    style = (
+        f"QScrollBar:vertical {{ width: {SCROLLBAR_THICKNESS_PX}px; background: transparent; margin: {SCROLLBAR_MARGIN_PX}px; }}\n"
+        f"QScrollBar::handle:vertical {{ background: {color}; border-radius: 0px; }}\n"
+        "QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical { height: 0px; background: transparent; }\n"
+        f"QScrollBar:horizontal {{ height: {SCROLLBAR_THICKNESS_PX}px; background: transparent; margin: {SCROLLBAR_MARGIN_PX}px; }}\n"
+        f"QScrollBar::handle:horizontal {{ background: {color}; border-radius: 0px; }}\n"
+        "QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal { width: 0px; background: transparent; }\n"
+    )
+    _SCROLLBAR_STYLE_CACHE[color] = style
+    return style
+
 class ZoomView(QGraphicsView):
     firstFrame = Signal()
     def __init__(self, bg_color: str = "#000", parent=None):
         super().__init__(parent)
         self._scene = QGraphicsScene(self)
+        # Single pixmap item: skip BSP index maintenance on every setPixmap
+        self._scene.setItemIndexMethod(QGraphicsScene.NoIndex)
         self.setScene(self._scene)
         self._pix = QGraphicsPixmapItem()
+        self._pix.setTransformationMode(Qt.SmoothTransformation)
         self._scene.addItem(self._pix)
         # Visuals
         try:
@@ -43,6 +81,9 @@ class ZoomView(QGraphicsView):
         except Exception:
             pass
         self._bg_color = bg_color
+        # Placeholder painter state is reused across repaints
+        self._placeholder_color = QColor(SUBTXT)
+        self._placeholder_font = None
         self.setRenderHints(QPainter.Antialiasing | QPainter.SmoothPixmapTransform)
         self.setDragMode(QGraphicsView.ScrollHandDrag)
         self.setTransformationAnchor(QGraphicsView.AnchorUnderMouse)
@@ -62,30 +103,26 @@ class ZoomView(QGraphicsView):
             "QGraphicsView { border: none; background: transparent; }\n"
             "QGraphicsView::viewport { background: transparent; border: none; }\n"
         )
-        self._scrollbar_qss = (
-            f"QScrollBar:vertical {{ width: {SCROLLBAR_THICKNESS_PX}px; background: transparent; margin: {SCROLLBAR_MARGIN_PX}px; }}\n"
-            f"QScrollBar::handle:vertical {{ background: {SCROLLBAR}; border-radius: 0px; }}\n"
-            "QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical { height: 0px; background: transparent; }\n"
-            f"QScrollBar:horizontal {{ height: {SCROLLBAR_THICKNESS_PX}px; background: transparent; margin: {SCROLLBAR_MARGIN_PX}px; }}\n"
-            f"QScrollBar::handle:horizontal {{ background: {SCROLLBAR}; border-radius: 0px; }}\n"
-            "QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal { width: 0px; background: transparent; }\n"
-        )
+        # The full sheet (base + thin scrollbars) is applied once here; auto-hide
+        # only toggles visibility, and set_theme reapplies it only on a colour change
+        self._scrollbar_color = SCROLLBAR
         try:
-            self.setStyleSheet(self._base_qss)
+            self.setStyleSheet(self._base_qss + _scrollbar_qss(SCROLLBAR))
             self.viewport().setStyleSheet("background: transparent; border: none;")
         except Exception:
             pass
-        self._scrollbar_style_applied = False
         # State
         self._has_image = False
         self._zoom = ZOOM_BASE
         self._min_zoom = ZOOM_MIN
         self._max_zoom = ZOOM_MAX
         self._emitted_first = False
-        self._last_pix_size = QSize()
+        self._last_pix_wh: tuple[int, int] | None = None
         self._pending_refit = False
+        self._scrollbars_shown = False
         self._sb_timer = QTimer(self)
         self._sb_timer.setSingleShot(True)
+        self._sb_timer.setTimerType(Qt.CoarseTimer)
         self._sb_timer.timeout.connect(self._hide_scrollbars)
         # Enable pinch gesture across platforms
         try:
@@ -93,45 +130,35 @@ class ZoomView(QGraphicsView):
         except Exception:
             pass
 
-    def _build_scrollbar_qss(self, color: str) -> str:
-        return (
-            f"QScrollBar:vertical {{ width: {SCROLLBAR_THICKNESS_PX}px; background: transparent; margin: {SCROLLBAR_MARGIN_PX}px; }}\n"
-            f"QScrollBar::handle:vertical {{ background: {color}; border-radius: 0px; }}\n"
-            "QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical { height: 0px; background: transparent; }\n"
-            f"QScrollBar:horizontal {{ height: {SCROLLBAR_THICKNESS_PX}px; background: transparent; margin: {SCROLLBAR_MARGIN_PX}px; }}\n"
-            f"QScrollBar::handle:horizontal {{ background: {color}; border-radius: 0px; }}\n"
-            "QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal { width: 0px; background: transparent; }\n"
-        )
-
     def set_theme(self, theme: dict[str, str]):
         bg_color = theme.get("BG", self._bg_color)
-        try:
-            self.setBackgroundBrush(QColor(bg_color))
-        except Exception as e:
-            APP_LOGGER.error(f"Error setting background brush in ZoomView: {e}")
-        try:
-            if self._scrollbar_style_applied:
-                self.setStyleSheet(self._base_qss + self._scrollbar_qss)
-            else:
-                self.setStyleSheet(self._base_qss)
-            self.viewport().setStyleSheet("background: transparent; border: none;")
-        except Exception:
-            pass
+        if bg_color != self._bg_color:
+            try:
+                self.setBackgroundBrush(QColor(bg_color))
+                self._bg_color = bg_color
+            except Exception as e:
+                APP_LOGGER.error(f"Error setting background brush in ZoomView: {e}")
+        # Stylesheet refresh may change the font; rebuild lazily on next paint
+        self._placeholder_font = None
+        scrollbar_color = theme.get("SCROLLBAR", self._scrollbar_color)
+        if scrollbar_color != self._scrollbar_color:
+            try:
+                self.setStyleSheet(self._base_qss + _scrollbar_qss(scrollbar_color))
+                self._scrollbar_color = scrollbar_color
+            except Exception as e:
+                APP_LOGGER.error(f"Error applying scrollbar style in ZoomView.set_theme: {e}")
 
     def set_image(self, pix: QPixmap):
-        has_pix = hasattr(pix, "isNull") and not pix.isNull()
-        size_changed = False
-        if has_pix:
-            new_size = pix.size()
-            if new_size != self._last_pix_size:
-                self._last_pix_size = QSize(new_size)
-                size_changed = True
-        else:
-            self._last_pix_size = QSize()
+        # Called at camera rate; callers always pass a QPixmap
         self._pix.setPixmap(pix)
-        if not has_pix:
+        if pix.isNull():
+            self._last_pix_wh = None
             self._has_image = False
             return
+        wh = (pix.width(), pix.height())
+        size_changed = wh != self._last_pix_wh
+        if size_changed:
+            self._last_pix_wh = wh
         needs_refit = False
         if self._pending_refit:
             needs_refit = True
@@ -144,20 +171,17 @@ class ZoomView(QGraphicsView):
             self._refit_view()
         self._pending_refit = False
         # Emit firstFrame once, on the first real pixmap
-        if not self._emitted_first and hasattr(pix, 'isNull') and not pix.isNull():
+        if not self._emitted_first:
             self._emitted_first = True
             try:
                 self.firstFrame.emit()
             except Exception:
                 pass
-        # Style thin scrollbars (once) without reintroducing a view border
-        if not self._scrollbar_style_applied:
+            # Seams only matter on the first draw; later frames repaint just the dirty region
             try:
-                self.setStyleSheet(self._base_qss + self._scrollbar_qss)
-                self.viewport().setStyleSheet("background: transparent; border: none;")
-            except Exception as e:
-                APP_LOGGER.error(f"Error applying scrollbar style in ZoomView.set_image: {e}")
-            self._scrollbar_style_applied = True
+                self.setViewportUpdateMode(QGraphicsView.MinimalViewportUpdate)
+            except Exception:
+                pass
 
     def reset_first_frame(self):
         """Allow the next real pixmap to emit firstFrame again and refit view."""
@@ -165,7 +189,11 @@ class ZoomView(QGraphicsView):
         has_pix = hasattr(current, "isNull") and not current.isNull() if current is not None else False
         self._emitted_first = False
         self._pending_refit = True
-        self._last_pix_size = QSize()
+        self._last_pix_wh = None
+        try:
+            self.setViewportUpdateMode(QGraphicsView.FullViewportUpdate)
+        except Exception:
+            pass
         if has_pix:
             self._has_image = True
         else:
@@ -186,27 +214,15 @@ class ZoomView(QGraphicsView):
         self._show_scrollbars_temporarily()
 
     def event(self, ev):
-        # macOS: QNativeGestureEvent for pinch
-        if ev.type() == QEvent.NativeGesture:
-            try:
-                # Some bindings expose gestureType/value on the event
-                gtype = getattr(ev, 'gestureType', None)
-                if callable(gtype):
-                    gtype = gtype()
-                val = getattr(ev, 'value', None)
-                if callable(val):
-                    val = val()
-            except Exception as e:
-                APP_LOGGER.error(f"Error processing NativeGesture in ZoomView.event: {e}")
-                pass
+        t = ev.type()
+        if t not in _GESTURE_EVENT_TYPES:
+            return super().event(ev)
         # Cross-platform: QPinchGesture via gesture events
-        if ev.type() == QEvent.Gesture:
+        if t == QEvent.Gesture:
             try:
                 pinch = ev.gesture(Qt.PinchGesture)
                 if pinch is not None:
-                    sf = getattr(pinch, 'scaleFactor', None)
-                    if callable(sf):
-                        sf = sf()
+                    sf = _PINCH_SCALE(pinch)
                     if sf:
                         self._zoom_by(float(sf))
                         ev.accept()
@@ -259,27 +275,57 @@ class ZoomView(QGraphicsView):
     def drawForeground(self, painter: QPainter, rect):
         super().drawForeground(painter, rect)
         if not self._has_image:
-            painter.save()
-            painter.setRenderHint(QPainter.Antialiasing)
-            painter.setPen(QColor(SUBTXT))
-            font = painter.font()
-            font.setPointSize(PLACEHOLDER_FONT_PT)
-            painter.setFont(font)
-            text = PLACEHOLDER_TEXT
-            br = painter.boundingRect(rect, Qt.AlignCenter, text)
-            painter.drawText(br, Qt.AlignCenter, text)
-            painter.restore()
+            font = self._placeholder_font
+            if font is None:
+                font = painter.font()
+                font.setPointSize(PLACEHOLDER_FONT_PT)
+                self._placeholder_font = font
+            pm = self._placeholder_pixmap(font)
+            dpr = pm.devicePixelRatio() or 1.0
+            w = pm.width() / dpr
+            h = pm.height() / dpr
+            center = rect.center()
+            painter.drawPixmap(QPointF(center.x() - w / 2, center.y() - h / 2), pm)
+
+    def _placeholder_pixmap(self, font) -> QPixmap:
+        # Blitting a cached text strip is cheaper than shaping the text every repaint
+        dpr = self.devicePixelRatioF()
+        key = f"nemesis:zoomview:placeholder:{self._placeholder_color.name()}:{font.key()}:{dpr}"
+        pm = QPixmapCache.find(key)
+        if pm is not None and not pm.isNull():
+            return pm
+        metrics = QFontMetrics(font)
+        w = metrics.horizontalAdvance(PLACEHOLDER_TEXT) + PLACEHOLDER_PAD_PX * 2
+        h = metrics.height() + PLACEHOLDER_PAD_PX * 2
+        pm = QPixmap(int(math.ceil(w * dpr)), int(math.ceil(h * dpr)))
+        pm.setDevicePixelRatio(dpr)
+        pm.fill(Qt.transparent)
+        p = QPainter(pm)
+        try:
+            p.setRenderHint(QPainter.Antialiasing)
+            p.setPen(self._placeholder_color)
+            p.setFont(font)
+            p.drawText(QRect(0, 0, w, h), Qt.AlignCenter, PLACEHOLDER_TEXT)
+        finally:
+            p.end()
+        QPixmapCache.insert(key, pm)
+        return pm
+
     def _show_scrollbars_temporarily(self):
+        # Mouse moves land here constantly; only the hidden -> shown edge touches the bars
         try:
-            if self.horizontalScrollBar():
-                self.horizontalScrollBar().setVisible(True)
-            if self.verticalScrollBar():
-                self.verticalScrollBar().setVisible(True)
+            if not self._scrollbars_shown:
+                self._scrollbars_shown = True
+                if self.horizontalScrollBar():
+                    self.horizontalScrollBar().setVisible(True)
+                if self.verticalScrollBar():
+                    self.verticalScrollBar().setVisible(True)
             self._sb_timer.start(SCROLLBAR_HIDE_DELAY_MS)
         except Exception:
             pass
 
     def _hide_scrollbars(self):
+        self._scrollbars_shown = False
         try:
             if self.horizontalScrollBar():
                 self.horizontalScrollBar().setVisible(False)
@@ -296,6 +342,8 @@ class AppZoomView(QGraphicsView):
         self._proxy: QGraphicsProxyWidget | None = None
         self._content: QWidget | None = None
         self._base_size: QSize = QSize(0, 0)
+        # Content minimum size, recomputed only after the content posts a LayoutRequest
+        self._content_min_hint: QSize | None = None
         self._bg_color = bg_color
         # Visuals
         try:
@@ -319,7 +367,8 @@ class AppZoomView(QGraphicsView):
         self.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
         self.horizontalScrollBar().setVisible(False)
         self.verticalScrollBar().setVisible(False)
-        self._scrollbar_style = self._build_scrollbar_style(SCROLLBAR)
+        self._scrollbar_style = _scrollbar_qss(SCROLLBAR)
+        self._last_qss = None
         self._apply_scrollbar_style()
         # State
         self._scale = 1.0
@@ -327,26 +376,21 @@ class AppZoomView(QGraphicsView):
         self._max_scale = APP_ZOOM_MAX
         self._sb_timer = QTimer(self)
         self._sb_timer.setSingleShot(True)
+        self._sb_timer.setTimerType(Qt.CoarseTimer)
         self._sb_timer.timeout.connect(self._hide_scrollbars)
         self._content_fits = True
+        self._geo_pending = False
         try:
             self.grabGesture(Qt.PinchGesture)
         except Exception:
             pass
 
-    def _build_scrollbar_style(self, color: str) -> str:
-        return (
-            f"QScrollBar:vertical {{ width: {SCROLLBAR_THICKNESS_PX}px; background: transparent; margin: {SCROLLBAR_MARGIN_PX}px; }}\n"
-            f"QScrollBar::handle:vertical {{ background: {color}; border-radius: 0px; }}\n"
-            "QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical { height: 0px; background: transparent; }\n"
-            f"QScrollBar:horizontal {{ height: {SCROLLBAR_THICKNESS_PX}px; background: transparent; margin: {SCROLLBAR_MARGIN_PX}px; }}\n"
-            f"QScrollBar::handle:horizontal {{ background: {color}; border-radius: 0px; }}\n"
-            "QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal { width: 0px; background: transparent; }\n"
-        )
-
     def _apply_scrollbar_style(self):
+        if self._scrollbar_style == self._last_qss:
+            return
         try:
             self.setStyleSheet(self._scrollbar_style)
+            self._last_qss = self._scrollbar_style
         except Exception:
             pass
 
@@ -357,13 +401,27 @@ class AppZoomView(QGraphicsView):
         except Exception:
             pass
         self._bg_color = bg_color
-        self._scrollbar_style = self._build_scrollbar_style(theme.get("SCROLLBAR", SCROLLBAR))
+        self._scrollbar_style = _scrollbar_qss(theme.get("SCROLLBAR", SCROLLBAR))
         self._apply_scrollbar_style()
 
     def set_content(self, w: QWidget):
-        self._scene.clear()
-        self._proxy = self._scene.addWidget(w)
-        self._content = w
+        if self._proxy is None or self._content is not w:
+            # Drop only the previous proxy (and its widget), not the whole scene
+            if self._proxy is not None:
+                try:
+                    self._scene.removeItem(self._proxy)
+                    self._proxy.deleteLater()
+                except Exception:
+                    self._scene.clear()
+            if self._content is not None:
+                try:
+                    self._content.removeEventFilter(self)
+                except Exception:
+                    pass
+            self._proxy = self._scene.addWidget(w)
+            self._content = w
+            w.installEventFilter(self)
+        self._content_min_hint = None
         self.resetTransform()
         self._scale = 1.0
         # Establish a fixed base content size to prevent reflow on zoom
@@ -391,12 +449,13 @@ class AppZoomView(QGraphicsView):
         self.set_scale(self._scale * factor)
 
     def event(self, ev):
-        if ev.type() == QEvent.NativeGesture:
+        t = ev.type()
+        if t not in _GESTURE_EVENT_TYPES:
+            return super().event(ev)
+        if t == QEvent.NativeGesture:
             try:
-                gtype = getattr(ev, 'gestureType', None)
-                if callable(gtype): gtype = gtype()
-                val = getattr(ev, 'value', None)
-                if callable(val): val = val()
+                gtype = _GESTURE_TYPE(ev)
+                val = _GESTURE_VALUE(ev)
                 if gtype == Qt.NativeGestureType.Zoom and val is not None:
                     factor = APP_ZOOM_MIN + (float(val) * PINCH_NATIVE_SCALE)
                     factor = max(PINCH_NATIVE_MIN, min(factor, PINCH_NATIVE_MAX))
@@ -404,12 +463,11 @@ class AppZoomView(QGraphicsView):
                     ev.accept(); return True
             except Exception:
                 pass
-        if ev.type() == QEvent.Gesture:
+        if t == QEvent.Gesture:
             try:
                 pinch = ev.gesture(Qt.PinchGesture)
                 if pinch is not None:
-                    sf = getattr(pinch, 'scaleFactor', None)
-                    if callable(sf): sf = sf()
+                    sf = _PINCH_SCALE(pinch)
                     if sf:
                         self.zoom_by(float(sf))
                         ev.accept(); return True
@@ -462,7 +520,14 @@ class AppZoomView(QGraphicsView):
 
     def resizeEvent(self, e):
         super().resizeEvent(e)
-        # Reflow content only when window resizes; pinch zoom does not trigger reflow
+        # Reflow content only when window resizes; pinch zoom does not trigger reflow.
+        # Live resizes fire many events per loop turn; apply only the last size.
+        if not self._geo_pending:
+            self._geo_pending = True
+            QTimer.singleShot(0, self, self._flush_geometry)
+
+    def _flush_geometry(self):
+        self._geo_pending = False
         self._apply_geometry_to_proxy()
         self._update_interaction_state()
 
@@ -474,19 +539,40 @@ class AppZoomView(QGraphicsView):
                 return
             vp = self.viewport().size()
             # Always size the embedded content to the current viewport on resize
-            hint = self._content.minimumSizeHint()
-            if not hint.isValid() or hint.width() <= 0 or hint.height() <= 0:
-                hint = self._content.sizeHint()
+            hint = self._content_min_size()
             min_w = max(1, hint.width())
             min_h = max(1, hint.height())
             w = max(min_w, int(vp.width()))
             h = max(min_h, int(vp.height()))
+            # Resizing the proxy or scene rect invalidates the whole scene; skip when unchanged
+            sr = self._scene.sceneRect()
+            if (
+                self._proxy.size().toSize() == QSize(w, h)
+                and sr.width() == w
+                and sr.height() == h
+                and self._proxy.pos().isNull()
+            ):
+                return
             self._proxy.setPos(0, 0)
             self._proxy.resize(w, h)
             self._scene.setSceneRect(0, 0, w, h)
         except Exception:
             pass
 
+    def _content_min_size(self) -> QSize:
+        hint = self._content_min_hint
+        if hint is None:
+            hint = self._content.minimumSizeHint()
+            if not hint.isValid() or hint.width() <= 0 or hint.height() <= 0:
+                hint = self._content.sizeHint()
+            self._content_min_hint = hint
+        return hint
+
+    def eventFilter(self, obj, ev):
+        if ev.type() == QEvent.LayoutRequest and obj is self._content:
+            self._content_min_hint = None
+        return super().eventFilter(obj, ev)
+
     def _update_interaction_state(self):
         try:
             vp = self.viewport().size()
@@ -496,7 +582,8 @@ class AppZoomView(QGraphicsView):
             content_fits = fits_w and fits_h
             self._content_fits = content_fits
             if self._scale <= APP_ZOOM_MIN + APP_ZOOM_EPS and content_fits:
-                self.setDragMode(QGraphicsView.NoDrag)
+                if self.dragMode() != QGraphicsView.NoDrag:
+                    self.setDragMode(QGraphicsView.NoDrag)
                 if self.horizontalScrollBar():
                     self.horizontalScrollBar().setRange(0, 0)
                     self.horizontalScrollBar().setVisible(False)
@@ -504,7 +591,8 @@ class AppZoomView(QGraphicsView):
                     self.verticalScrollBar().setRange(0, 0)
                     self.verticalScrollBar().setVisible(False)
             else:
-                self.setDragMode(QGraphicsView.ScrollHandDrag)
+                if self.dragMode() != QGraphicsView.ScrollHandDrag:
+                    self.setDragMode(QGraphicsView.ScrollHandDrag)
                 if self.horizontalScrollBar():
                     self.horizontalScrollBar().setVisible(True)
                 if self.verticalScrollBar():
@@ -1,5 +1,6 @@
 from app.core.scheduler import TapScheduler
 from app.core.logger import RunLogger
+from app.core.resources import ResourceRegistry
 from app.drivers.arduino_driver import SerialLink
 
 # --- TapScheduler Tests ---
@@ -55,6 +56,78 @@ def test_run_logger(tmp_path):
         assert row["stepsize"] == "3"
         assert row["notes"] == "test note"
 
+def test_run_logger_background_flush(tmp_path):
+    run_dir = tmp_path / "bg_run"
+    logger = RunLogger(run_dir=run_dir, run_id="bg_id")
+    batches = []
+    write_rows = logger._w.writerows
+    def _spy(rows):
+        batches.append(len(rows))
+        write_rows(rows)
+    logger._w.writerows = _spy
+    for i in range(5):
+        logger.log_tap(host_time_s=float(i), mode="Periodic")
+
+    # Rows reach disk without an explicit flush or close
+    import csv, time
+    deadline = time.monotonic() + 2.0
+    rows = []
+    while time.monotonic() < deadline:
+        with open(run_dir / "taps.csv", "r", encoding="utf-8") as f:
+            rows = list(csv.DictReader(f))
+        if len(rows) == 5:
+            break
+        time.sleep(0.02)
+    assert [row["tap_id"] for row in rows] == ["1", "2", "3", "4", "5"]
+    assert not logger.has_unsaved_data()
+    # The whole burst went out in one batch
+    assert batches == [5]
+    logger.close()
+
+    # Taps after close are rejected rather than stranded in the buffer
+    logger.log_tap(host_time_s=9.0, mode="Periodic")
+    assert not logger.has_unsaved_data()
+    assert logger.retry_flush()
+
+def test_run_logger_reopen_no_space(tmp_path, monkeypatch):
+    import errno
+    logger = RunLogger(run_dir=tmp_path / "full_run", run_id="full_id")
+    # Simulate taps.csv having been dropped and the disk now being full
+    logger._f.close()
+    logger._f = None
+    logger._w = None
+    def _no_space(*args, **kwargs):
+        raise OSError(errno.ENOSPC, "No space left on device")
+    monkeypatch.setattr("app.core.logger.open", _no_space, raising=False)
+
+    logger.log_tap(host_time_s=1.0, mode="Periodic")
+    assert logger.retry_flush() is False
+    err, no_space = logger.consume_flush_error()
+    assert isinstance(err, OSError)
+    assert no_space is True
+    assert logger.has_unsaved_data()
+    monkeypatch.undo()
+    logger.close()
+
+# --- ResourceRegistry Tests ---
+def test_resource_registry_release_all():
+    registry = ResourceRegistry()
+    tab_a, tab_b = object(), object()
+    assert registry.claim_camera(tab_a, 0) == (True, None)
+    assert registry.claim_camera(tab_a, 1) == (True, None)
+    assert registry.claim_serial(tab_a, " COM3 ") == (True, None)
+    assert registry.claim_camera(tab_b, 0) == (False, tab_a)
+    assert registry.claim_camera(tab_b, 2) == (True, None)
+
+    registry.release_camera(tab_a, 1)
+    registry.release_all(tab_a)
+
+    assert registry.claim_camera(tab_b, 0) == (True, None)
+    assert registry.claim_camera(tab_b, 1) == (True, None)
+    assert registry.claim_serial(tab_b, "COM3") == (True, None)
+    registry.release_all(tab_b)
+    assert registry.claim_camera(tab_a, 2) == (True, None)
+
 # --- SerialLink Tests ---
 # Note: Real hardware is not attached, so we test behavior without a real port.
 def test_serial_link_init():
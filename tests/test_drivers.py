@@ -21,6 +21,24 @@ def test_serial_link_reading():
     
     link.close()
 
+def test_serial_link_read_lines_nowait():
+    link = SerialLink()
+    mock_ser = MagicMock()
+    mock_ser.read.side_effect = [b'A\nB\r\nC\n', b'']
+    mock_ser.is_open = True
+
+    link.ser = mock_ser
+    link._start_reader()
+
+    time.sleep(0.1)
+
+    lines = link.read_lines_nowait()
+    assert lines[:3] == ["A", "B", "C"]
+    assert link.read_lines_nowait() == []
+    assert link.read_line_nowait() is None
+
+    link.close()
+
 def test_serial_link_error_handling():
     link = SerialLink()
     mock_ser = MagicMock()
@@ -50,3 +68,40 @@ def test_serial_link_wait_for():
     assert link.wait_for("FAIL", timeout_s=0.1) is False
     
     link.close()
+
+def test_serial_link_wait_for_keeps_later_lines():
+    link = SerialLink()
+    for line in ("NOISE", "CONFIG:OK", "EVENT:TAP"):
+        link._rx_queue.put((1.0, line))
+
+    assert link.wait_for("CONFIG:OK", timeout_s=0.1) is True
+    assert link.read_lines_nowait() == ["EVENT:TAP"]
+
+def test_serial_link_rx_callback():
+    link = SerialLink()
+    notified = []
+    link.set_rx_callback(lambda: notified.append(True))
+    mock_ser = MagicMock()
+    mock_ser.read.side_effect = [b'A\nB\n', b'']
+    mock_ser.is_open = True
+
+    link.ser = mock_ser
+    link._start_reader()
+
+    time.sleep(0.1)
+
+    # One notification for the two-line chunk, one for the disconnect error
+    assert len(notified) == 2
+    assert link.read_lines_nowait()[:2] == ["A", "B"]
+
+    link.close()
+
+def test_serial_link_send_bytes_single_write():
+    link = SerialLink()
+    mock_ser = MagicMock()
+    mock_ser.is_open = True
+    link.ser = mock_ser
+
+    assert link.send_bytes(b"cP,4,2.0\n") is True
+    mock_ser.write.assert_called_once_with(b"cP,4,2.0\n")
+    assert link.send_bytes(b"") is False